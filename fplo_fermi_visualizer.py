@@ -42,6 +42,11 @@ class FPLOFermiVisualizer:
         self.band_energies = None
         self.band_weights = None
         self.num_bands = 0
+        # 权重仅用于求和与点大小映射，float32 足够且减半内存带宽；
+        # 如需 float64 精度比较可关闭此开关
+        self.use_float32_weights = True
+        # k 点与能带能量只用于绘图（Agg 后端内部即按 float32 处理），同样以 float32 存储
+        self.use_float32_coords = True
         self.output_folder = None
         
         # 费米面分析相关
@@ -336,9 +341,11 @@ class FPLOFermiVisualizer:
             self.band_energies.append(energies_at_k)
             self.band_weights.append(weights_at_k)
         
-        self.k_points = np.array(self.k_points)
-        self.band_energies = np.array(self.band_energies)
-        self.band_weights = np.array(self.band_weights)
+        coords_dtype = np.float32 if self.use_float32_coords else None
+        self.k_points = np.array(self.k_points, dtype=coords_dtype)
+        self.band_energies = np.array(self.band_energies, dtype=coords_dtype)
+        weights_dtype = np.float32 if self.use_float32_weights else None
+        self.band_weights = np.array(self.band_weights, dtype=weights_dtype)
         self.num_bands = num_bands
         self.num_kpoints = len(self.k_points)
         self.weights_data = self.band_weights  # 为了兼容新函数
@@ -1070,11 +1077,13 @@ class FPLOFermiVisualizer:
                 continue
 
             color = self.orbital_colors.get(orbital_key, '#95A5A6')
+            # 轨道列下标只转换一次，循环内单次高级索引，不再先复制整个能带切片
+            cols = np.asarray(indices, dtype=np.intp)
             has_visible_weight = False
 
             for band_idx in self.important_bands:  # 只处理重要能带
                 band_energies = self.band_energies[:, band_idx]
-                orbital_weights = np.sum(self.band_weights[:, band_idx, :][:, indices], axis=1)
+                orbital_weights = np.sum(self.band_weights[:, band_idx, cols], axis=1)
 
                 # 能量窗口内的权重
                 mask = (band_energies >= self.energy_window[0]) & (band_energies <= self.energy_window[1])
@@ -1203,13 +1212,14 @@ class FPLOFermiVisualizer:
 
                 # 绘制该轨道的权重，只关注重要能带
                 color = self.orbital_colors.get(orbital_key, '#95A5A6')
+                cols = np.asarray(indices, dtype=np.intp)
                 max_weight = 0
                 min_weight = float('inf')
                 has_data = False
 
                 for band_idx in self.important_bands:  # 只处理重要能带
                     band_energies = self.band_energies[:, band_idx]
-                    orbital_weights = np.sum(self.band_weights[:, band_idx, :][:, indices], axis=1)
+                    orbital_weights = np.sum(self.band_weights[:, band_idx, cols], axis=1)
 
                     # 能量窗口内的权重
                     mask = (band_energies >= self.energy_window[0]) & (band_energies <= self.energy_window[1])
@@ -25,13 +25,15 @@ import traceback
 import multiprocessing
 import hashlib
 import pickle
-from functools import lru_cache
+from types import MappingProxyType
+from functools import lru_cache, partial
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout,
                              QWidget, QPushButton, QFileDialog, QTextEdit, QSplitter,
                              QGroupBox, QCheckBox, QSlider, QLabel, QComboBox,
                              QSpinBox, QDoubleSpinBox, QLineEdit, QColorDialog,
-                             QMessageBox, QProgressBar, QTabWidget, QScrollArea, QGridLayout)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
+                             QMessageBox, QProgressBar, QTabWidget, QScrollArea, QGridLayout,
+                             QListView, QAbstractButton)
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, pyqtSlot, QTimer
 from PyQt5.QtGui import QFont, QColor, QPalette
 
 # 导入日志管理器
@@ -68,6 +70,8 @@ except Exception as e:
 import numpy as np
 import re
 import colorsys
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba_array
 from matplotlib.patches import Rectangle
 from matplotlib.text import Text
 
@@ -79,8 +83,113 @@ from fplo_fermi_visualizer import FPLOFermiVisualizer
 from performance_monitor import PerformanceMonitor
 
 # 引入拆分后的模块
-from gui.tools import MultiCoreProcessor, DataLoaderThread, process_single_orbital
+from gui.tools import (MultiCoreProcessor, DataLoaderThread, process_single_orbital, compute_orbital_weights,
+                       filter_topk, chunked_weight_to_size)
 from gui.log_widget import LogWidget
+from gui.orbital_list import OrbitalListModel, OrbitalItemDelegate
+
+# 模块导入时探测一次CPU核心数，避免在界面构建期间重复系统调用
+_CPU_COUNT = multiprocessing.cpu_count()
+_MP_TOOLTIP = f"使用多核处理加速绘图 (检测到{_CPU_COUNT}核)"
+
+# 轨道类型 = 主量子数 n（可省略）+ ℓ 字母，用于排序键解析
+_ORBITAL_TYPE_RE = re.compile(r'(\d*)([spdf])')
+_L_PRIORITY = {'s': 0, 'p': 1, 'd': 2, 'f': 3}
+
+# 学术标准颜色方案：按轨道类型 (s/p/d/f) 取色系，同类型内轮换 (基于常见的学术惯例)
+_ACADEMIC_COLORS = MappingProxyType({
+    's': ('#1f77b4', '#aec7e8', '#c5dbf1'),  # 蓝色系 (s轨道)
+    'p': ('#ff7f0e', '#ffbb78', '#ffd1a3'),  # 橙色系 (p轨道)
+    'd': ('#2ca02c', '#98df8a', '#c7e9c7'),  # 绿色系 (d轨道)
+    'f': ('#d62728', '#ff9896', '#ffb3b3'),  # 红色系 (f轨道)
+})
+
+# 多彩颜色方案
+_COLORFUL_COLORS = (
+    '#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7',
+    '#DDA0DD', '#98D8C8', '#F7DC6F', '#BB8FCE', '#85C1E9',
+    '#F8C471', '#82E0AA', '#F1948A', '#85C1E9', '#D7BDE2',
+)
+
+# 单色方案 (灰度)
+_MONOCHROME_COLORS = (
+    '#2C3E50', '#34495E', '#5D6D7E', '#85929E', '#AEB6BF',
+    '#D5DBDB', '#BDC3C7', '#95A5A6', '#7F8C8D', '#566573',
+)
+
+# [Fix 20250825] 固定30色方案：6 个色系，每系 5 个颜色（均不含 light/dark 关键词）
+_FAMILY_PALETTE = MappingProxyType({
+    'red':    ('#FF0000', '#B22222', '#DC143C', '#FF6347', '#FF4500'),
+    'orange': ('#FFA500', '#FFD700', '#DAA520', '#FFFF00', '#F0E68C'),
+    'green':  ('#008000', '#00FF00', '#7CFC00', '#7FFF00', '#9ACD32'),
+    'cyan':   ('#00FFFF', '#40E0D0', '#7FFFD4', '#48D1CC', '#5F9EA0'),
+    'blue':   ('#0000FF', '#4169E1', '#6495ED', '#1E90FF', '#00BFFF'),
+    'violet': ('#800080', '#EE82EE', '#FF00FF', '#8A2BE2', '#DA70D6'),
+})
+_FAMILY_ORDER = ('red', 'orange', 'green', 'cyan', 'blue', 'violet')
+
+# 手动覆盖映射（优先于哈希；可按需扩展/外部配置）
+# [Preset 20250825] 常见元素的色系归类
+_MANUAL_FAMILY = MappingProxyType({
+    # red
+    'O': 'red', 'Br': 'red',
+    # orange（黄/橙系）
+    'S': 'orange', 'P': 'orange', 'Si': 'orange', 'B': 'orange',
+    'Al': 'orange', 'Fe': 'orange', 'Cu': 'orange', 'Au': 'orange',
+    # green（卤素/碱土/部分过渡金属）
+    'F': 'green', 'Cl': 'green', 'Be': 'green', 'Mg': 'green',
+    'Ca': 'green', 'Cr': 'green', 'V': 'green', 'Ni': 'green',
+    # cyan（H/C 及若干金属）
+    'H': 'cyan', 'C': 'cyan', 'Zn': 'cyan', 'Mo': 'cyan',
+    'W': 'cyan', 'Se': 'cyan',
+    # blue（N/稀有气体/部分金属）
+    'N': 'blue', 'He': 'blue', 'Ne': 'blue', 'Ar': 'blue',
+    'Kr': 'blue', 'Xe': 'blue', 'Ti': 'blue', 'Co': 'blue',
+    'Ag': 'blue', 'Pt': 'blue',
+    # violet（碱金属/碱土及部分）
+    'Li': 'violet', 'Na': 'violet', 'K': 'violet', 'Rb': 'violet',
+    'Cs': 'violet', 'Ba': 'violet', 'Mn': 'violet', 'I': 'violet',
+})
+
+
+@lru_cache(maxsize=None)
+def _element_to_family(element):
+    """元素 → 色系：手动映射优先，否则按字符编码求和对 6 取模（稳定哈希）"""
+    family = _MANUAL_FAMILY.get(element)
+    if family in _FAMILY_PALETTE:
+        return family
+    return _FAMILY_ORDER[sum(ord(c) for c in element) % len(_FAMILY_ORDER)]
+
+
+@lru_cache(maxsize=None)
+def _parse_orbital_type(type_part):
+    """解析轨道类型部分（nℓ 或仅 ℓ），返回排序键 (ℓ优先级, n, 原串)"""
+    l_letter = type_part[-1] if (type_part and type_part[-1] in _L_PRIORITY) else ''
+    n_part = type_part[:-1] if (len(type_part) > 1 and l_letter) else ''
+    try:
+        n_val = int(n_part) if n_part != '' else -1
+    except ValueError:
+        n_val = 10**9
+    return (_L_PRIORITY.get(l_letter, 999), n_val, type_part)
+
+
+# 图例代理图元只用于生成图例句柄，不加入图形；按样式缓存后在多次重绘之间复用
+@lru_cache(maxsize=1024)
+def _legend_marker_proxy(label, color):
+    """轨道图例代理：带黑色细边框的圆点"""
+    return plt.Line2D([0], [0], marker='o', color='w', markerfacecolor=color, markersize=8,
+                      markeredgecolor='black', markeredgewidth=0.5, label=label)
+
+
+@lru_cache(maxsize=64)
+def _legend_line_proxy(label, color, linestyle, linewidth, alpha):
+    """线条图例代理（费米能级、能带线）"""
+    return plt.Line2D([0], [0], color=color, linestyle=linestyle, linewidth=linewidth,
+                      alpha=alpha, label=label)
+
+
+# 透明度滑块取值 0-100，对应的标签文字预先格式化，拖动时直接按下标取用
+_ALPHA_STRINGS = tuple(f"{i / 100:.1f}" for i in range(101))
 
 # ============================================================================
 # 2. 工具类模块（已迁移）
@@ -99,6 +208,9 @@ from gui.log_widget import LogWidget
 class InteractivePlotWidget(QWidget):
     """增强的交互式绘图组件"""
 
+    # 屏幕DPI，首个绘图组件创建时从 Qt 查询一次
+    _cached_dpi = None
+
     def __init__(self):
         super().__init__()
         self.visualizer = None
@@ -109,9 +221,22 @@ class InteractivePlotWidget(QWidget):
         # 初始化多核处理器（已删除缓存机制，采用全量重绘）
         self.multicore_processor = MultiCoreProcessor()
 
+        # 持久坐标轴与图元：重绘时复用坐标轴，只更新能带线、散点和费米线的数据
+        self._axes = None
+        self._band_lines = None
+        self._fermi_line = None
+        # 所有可见轨道共用一个持久的散点集合（PathCollection），每次重绘只更新数据
+        self._orbital_collection = None
+
+        # 最近一次成功绘制时的视图指纹，内容未变的重复请求直接跳过
+        self._last_view_fingerprint = None
+        # 最近一次应用高级设置时的 (坐标轴, 设置值)，持久坐标轴上设置未变时不再重复应用
+        self._advanced_settings_state = None
+
         # 框选放大相关
         self.zoom_mode = False
         self.zoom_rect = None
+        self._zoom_background = None  # 框选时缓存的坐标轴背景（blit 用）
         self.current_xlim = None
         self.current_ylim = None
         self.is_zoomed = False  # 标记是否处于缩放状态
@@ -176,6 +301,7 @@ class InteractivePlotWidget(QWidget):
             'max_points_per_orbital': 500,  # 每个轨道最大点数（降低）
             'use_fast_rendering': True,     # 使用快速渲染
             'use_multiprocessing': True,    # 使用多核处理
+            'rasterize_scatter': True,      # 轨道散点栅格化（加快重绘、减小矢量导出体积）
 
             # 学术标准颜色方案
             'color_scheme': 'academic'  # academic, colorful, monochrome
@@ -183,19 +309,21 @@ class InteractivePlotWidget(QWidget):
 
         self.init_ui()
 
+    @classmethod
+    def _screen_dpi(cls):
+        """主屏幕逻辑DPI（限制在 72-150），首次查询后缓存在类上"""
+        if cls._cached_dpi is None:
+            screen = QApplication.primaryScreen()
+            dpi = screen.logicalDotsPerInch() if screen is not None else 100  # 默认DPI
+            cls._cached_dpi = max(72, min(dpi, 150))  # 限制DPI范围
+        return cls._cached_dpi
+
     def init_ui(self):
         layout = QVBoxLayout()
 
         try:
             # 创建matplotlib图形 - 自适应DPI
-            import tkinter as tk
-            try:
-                root = tk.Tk()
-                dpi = root.winfo_fpixels('1i')
-                root.destroy()
-                dpi = max(72, min(dpi, 150))  # 限制DPI范围
-            except:
-                dpi = 100  # 默认DPI
+            dpi = self._screen_dpi()
 
             self.figure = Figure(figsize=(12, 8), dpi=dpi)
             self.canvas = FigureCanvas(self.figure)
@@ -240,13 +368,13 @@ class InteractivePlotWidget(QWidget):
         # 默认设置为完整能带可视化器
         self.complete_visualizer = visualizer
         self.visualizer = visualizer
+        self._last_view_fingerprint = None  # 新数据必须重绘
         self.current_plot_type = "complete"
 
         print("默认使用完整能带模式")
 
         # 初始化轨道可见性 - 默认全部不显示，减少初始化时间
-        for orbital_key in visualizer.orbital_info.keys():
-            self.visible_orbitals[orbital_key] = False
+        self.visible_orbitals.update(dict.fromkeys(visualizer.orbital_info, False))
 
         # 自动分配颜色
         self._assign_colors()
@@ -259,32 +387,20 @@ class InteractivePlotWidget(QWidget):
         print("初始化完成，只显示能带骨架，轨道权重默认隐藏以提高性能")
         self.plot_current_view()
 
+    def _get_sorted_orbital_keys(self):
+        """获取按名称排序的轨道键元组（按可视化器缓存，切换配色方案时不再重复排序）"""
+        sorted_keys = getattr(self.visualizer, '_sorted_orbital_keys', None)
+        if sorted_keys is None:
+            sorted_keys = tuple(sorted(self.visualizer.orbital_info))
+            self.visualizer._sorted_orbital_keys = sorted_keys
+        return sorted_keys
+
     def _assign_colors(self):
         """根据当前颜色方案分配颜色"""
         if not self.visualizer:
             return
 
-        # 学术标准颜色方案
-        academic_colors = {
-            # 元素特定颜色 (基于常见的学术惯例)
-            's': ['#1f77b4', '#aec7e8', '#c5dbf1'],  # 蓝色系 (s轨道)
-            'p': ['#ff7f0e', '#ffbb78', '#ffd1a3'],  # 橙色系 (p轨道)
-            'd': ['#2ca02c', '#98df8a', '#c7e9c7'],  # 绿色系 (d轨道)
-            'f': ['#d62728', '#ff9896', '#ffb3b3']   # 红色系 (f轨道)
-        }
-
-        # 多彩颜色方案
-        colorful_colors = [
-            '#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7',
-            '#DDA0DD', '#98D8C8', '#F7DC6F', '#BB8FCE', '#85C1E9',
-            '#F8C471', '#82E0AA', '#F1948A', '#85C1E9', '#D7BDE2'
-        ]
-
-        # 单色方案 (灰度)
-        monochrome_colors = [
-            '#2C3E50', '#34495E', '#5D6D7E', '#85929E', '#AEB6BF',
-            '#D5DBDB', '#BDC3C7', '#95A5A6', '#7F8C8D', '#566573'
-        ]
+        sorted_keys = self._get_sorted_orbital_keys()
 
         color_scheme = self.plot_settings.get('color_scheme', 'academic')
         print(f"应用颜色方案: {color_scheme}")
@@ -297,11 +413,11 @@ class InteractivePlotWidget(QWidget):
             for orbital_type in ['s', 'p', 'd', 'f']:
                 color_index[orbital_type] = 0
 
-            for orbital_key in sorted(self.visualizer.orbital_info.keys()):
+            for orbital_key in sorted_keys:
                 _, orbital_type = orbital_key.split('_')
 
-                if orbital_type in academic_colors:
-                    colors = academic_colors[orbital_type]
+                if orbital_type in _ACADEMIC_COLORS:
+                    colors = _ACADEMIC_COLORS[orbital_type]
                     color = colors[color_index[orbital_type] % len(colors)]
                     color_index[orbital_type] += 1
                 else:
@@ -312,15 +428,15 @@ class InteractivePlotWidget(QWidget):
         elif color_scheme == 'colorful':
             print("使用多彩颜色方案")
             # 使用多彩颜色方案
-            for i, orbital_key in enumerate(sorted(self.visualizer.orbital_info.keys())):
-                color = colorful_colors[i % len(colorful_colors)]
+            for i, orbital_key in enumerate(sorted_keys):
+                color = _COLORFUL_COLORS[i % len(_COLORFUL_COLORS)]
                 self.visualizer.orbital_colors[orbital_key] = color
 
         elif color_scheme == 'monochrome':
             print("使用单色方案")
             # 使用单色方案
-            for i, orbital_key in enumerate(sorted(self.visualizer.orbital_info.keys())):
-                color = monochrome_colors[i % len(monochrome_colors)]
+            for i, orbital_key in enumerate(sorted_keys):
+                color = _MONOCHROME_COLORS[i % len(_MONOCHROME_COLORS)]
                 self.visualizer.orbital_colors[orbital_key] = color
 
         # 说明：针对“元素+nℓ”键，按ℓ（s/p/d/f）分桶，对每个ℓ下的n进行全局轮换，使用高对比度调色板
@@ -328,121 +444,27 @@ class InteractivePlotWidget(QWidget):
         try:
             scheme = self.plot_settings.get('color_scheme', 'academic')
             if scheme in ('academic', 'colorful') and hasattr(self.visualizer, 'orbital_info'):
-                # 高对比度基色（matplotlib/tab10风格），在每个ℓ内轮换
-                high_contrast_palette = [
-                    '#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd',
-                    '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf'
-                ]
-
-                # 收集每个ℓ下的所有n（全局），用于稳定轮换
-                l_to_ns = {l: [] for l in ['s', 'p', 'd', 'f']}
-                for orbital_key in self.visualizer.orbital_info.keys():
-                    # 提取类型部分：nℓ 或 仅ℓ
-                    if '_' in orbital_key:
-                        type_part = orbital_key.split('_', 1)[1]
-                    else:
-                        type_part = orbital_key
-
-                    # 末尾字母若为spdf则为ℓ
-                    l_letter = type_part[-1] if type_part and type_part[-1] in 'spdf' else None
-                    if l_letter not in l_to_ns:
-                        continue
-                    n_part = type_part[:-1] if l_letter and len(type_part) > 1 else ''
-                    # 统一保存为字符串，空表示无n
-                    if n_part not in l_to_ns[l_letter]:
-                        l_to_ns[l_letter].append(n_part)
-
-                # 对每个ℓ的n集合进行排序（数值优先，其次字典序），确保全局一致
-                for l in l_to_ns:
-                    def n_key(n):
-                        try:
-                            return (0, int(n))
-                        except:
-                            return (1, n)
-                    l_to_ns[l].sort(key=n_key)
-
                 # [Fix 20250825] 使用固定30色方案：元素→色系哈希/手动映射；元素内按 ℓ→n 循环取色
-                # 6 个色系，每系 5 个颜色（均不含 light/dark 关键词）
-                family_palette = {
-                    'red':    ['#FF0000', '#B22222', '#DC143C', '#FF6347', '#FF4500'],
-                    'orange': ['#FFA500', '#FFD700', '#DAA520', '#FFFF00', '#F0E68C'],
-                    'green':  ['#008000', '#00FF00', '#7CFC00', '#7FFF00', '#9ACD32'],
-                    'cyan':   ['#00FFFF', '#40E0D0', '#7FFFD4', '#48D1CC', '#5F9EA0'],
-                    'blue':   ['#0000FF', '#4169E1', '#6495ED', '#1E90FF', '#00BFFF'],
-                    'violet': ['#800080', '#EE82EE', '#FF00FF', '#8A2BE2', '#DA70D6'],
-                }
-                family_order = ['red', 'orange', 'green', 'cyan', 'blue', 'violet']
-
-                # 手动覆盖映射（优先于哈希；可按需扩展/外部配置）
-                # [Preset 20250825] 常见元素的色系归类
-                manual_family = {
-                    # red
-                    'O': 'red', 'Br': 'red',
-                    # orange（黄/橙系）
-                    'S': 'orange', 'P': 'orange', 'Si': 'orange', 'B': 'orange',
-                    'Al': 'orange', 'Fe': 'orange', 'Cu': 'orange', 'Au': 'orange',
-                    # green（卤素/碱土/部分过渡金属）
-                    'F': 'green', 'Cl': 'green', 'Be': 'green', 'Mg': 'green',
-                    'Ca': 'green', 'Cr': 'green', 'V': 'green', 'Ni': 'green',
-                    # cyan（H/C 及若干金属）
-                    'H': 'cyan', 'C': 'cyan', 'Zn': 'cyan', 'Mo': 'cyan',
-                    'W': 'cyan', 'Se': 'cyan',
-                    # blue（N/稀有气体/部分金属）
-                    'N': 'blue', 'He': 'blue', 'Ne': 'blue', 'Ar': 'blue',
-                    'Kr': 'blue', 'Xe': 'blue', 'Ti': 'blue', 'Co': 'blue',
-                    'Ag': 'blue', 'Pt': 'blue',
-                    # violet（碱金属/碱土及部分）
-                    'Li': 'violet', 'Na': 'violet', 'K': 'violet', 'Rb': 'violet',
-                    'Cs': 'violet', 'Ba': 'violet', 'Mn': 'violet', 'I': 'violet',
-                }
-
-                def element_to_family(element):
-                    # 手动映射优先
-                    fam = manual_family.get(element)
-                    if fam in family_palette:
-                        return fam
-                    # 稳定哈希：按字符编码求和对 6 取模
-                    idx = sum(ord(c) for c in element) % len(family_order)
-                    return family_order[idx]
-
-                # 解析 type_part，返回排序键 (ℓ优先级, n, 原串)
-                def parse_type(type_part):
-                    l_letter = type_part[-1] if (type_part and type_part[-1] in ['s', 'p', 'd', 'f']) else ''
-                    n_part = type_part[:-1] if (len(type_part) > 1 and l_letter) else ''
-                    try:
-                        n_val = int(n_part) if n_part != '' else -1
-                    except Exception:
-                        n_val = 10**9
-                    l_priority = {'s': 0, 'p': 1, 'd': 2, 'f': 3}.get(l_letter, 999)
-                    return (l_priority, n_val, type_part)
-
-                # 构建：元素 -> 其所有 type_part 集合
+                # 色系常量与 _element_to_family/_parse_orbital_type 在模块级定义并缓存
+
+                # 构建：元素 -> 其所有 type_part 集合（无下划线的键整体作为元素与类型）
                 element_types = {}
                 for ok in self.visualizer.orbital_info.keys():
-                    if '_' in ok:
-                        element, type_part = ok.split('_', 1)
-                    else:
-                        element, type_part = ok, ok
-                    element_types.setdefault(element, set()).add(type_part)
+                    element, sep, type_part = ok.partition('_')
+                    element_types.setdefault(element, set()).add(type_part if sep else ok)
 
                 # 为每个元素分配其色系，并按 ℓ→n 排序循环上色
                 type_color_map = {}
                 for element, type_set in element_types.items():
-                    family = element_to_family(element)
-                    palette = family_palette[family]
-                    sorted_types = sorted(type_set, key=lambda t: parse_type(t))
-                    for i, t in enumerate(sorted_types):
+                    palette = _FAMILY_PALETTE[_element_to_family(element)]
+                    for i, t in enumerate(sorted(type_set, key=_parse_orbital_type)):
                         type_color_map[(element, t)] = palette[i % len(palette)]
 
                 # 回填到每个 orbital_key
                 new_colors = {}
-                for ok in sorted(self.visualizer.orbital_info.keys()):
-                    if '_' in ok:
-                        element, type_part = ok.split('_', 1)
-                    else:
-                        element, type_part = ok, ok
-                    color = type_color_map.get((element, type_part), '#95A5A6')
-                    new_colors[ok] = color
+                for ok in sorted_keys:
+                    element, sep, type_part = ok.partition('_')
+                    new_colors[ok] = type_color_map.get((element, type_part if sep else ok), '#95A5A6')
 
                 # 覆盖颜色
                 self.visualizer.orbital_colors.update(new_colors)
@@ -460,8 +482,23 @@ class InteractivePlotWidget(QWidget):
 
         print(f"颜色分配完成，共 {len(self.visualizer.orbital_colors)} 个轨道")
 
-    def plot_current_view(self):
-        """根据当前视图模式绘制 - 简化版本"""
+    def _view_fingerprint(self):
+        """当前视图的指纹：视图模式、可视化器、轨道可见性、绘图/图例设置与缩放范围"""
+        settings_digest = hashlib.blake2b(
+            repr((sorted(self.plot_settings.items()), sorted(self.legend_settings.items()))).encode(),
+            digest_size=16).digest()
+        limits = None
+        if self.is_zoomed and self.figure.axes:
+            ax = self.figure.axes[0]
+            limits = (ax.get_xlim(), ax.get_ylim())
+        return (self.current_plot_type, id(self.visualizer),
+                tuple(sorted(self.visible_orbitals.items())), settings_digest, limits)
+
+    def plot_current_view(self, force=False):
+        """根据当前视图模式绘制 - 简化版本
+
+        与上次绘制相比没有任何变化时跳过重绘；force=True（如手动刷新）时总是重绘。
+        """
         current_mode = getattr(self, 'current_plot_type', 'complete')
         log_debug(f"绘制视图: {current_mode}")
 
@@ -470,6 +507,12 @@ class InteractivePlotWidget(QWidget):
             log_warning("无可视化器，跳过绘制")
             return
 
+        fingerprint = self._view_fingerprint()
+        if not force and fingerprint == self._last_view_fingerprint:
+            log_debug("视图内容未变化，跳过重绘")
+            return
+        self._last_view_fingerprint = None
+
         # 保存缩放状态
         saved_xlim, saved_ylim = None, None
         if self.is_zoomed and hasattr(self.figure, 'axes') and self.figure.axes:
@@ -503,19 +546,23 @@ class InteractivePlotWidget(QWidget):
                 # 只有在非费米专注模式下才恢复Y轴缩放
                 if current_mode != "fermi":
                     ax.set_ylim(saved_ylim)
-                    print(f"恢复缩放: X={saved_xlim}, Y={saved_ylim}")
+                    log_debug(f"恢复缩放: X={saved_xlim}, Y={saved_ylim}")
                 else:
-                    print(f"费米专注模式: 只恢复X轴缩放={saved_xlim}, 保持费米窗口Y轴设置")
+                    log_debug(f"费米专注模式: 只恢复X轴缩放={saved_xlim}, 保持费米窗口Y轴设置")
 
         # 强制刷新画布
         try:
             self.canvas.draw()
             self.canvas.flush_events()
-            print(f"画布已强制刷新")
+            log_debug("画布已强制刷新")
         except Exception as e:
             print(f"画布刷新失败: {e}")
+            return
 
-        print(f"视图 {current_mode} 绘制完成")
+        # 记录绘制前的指纹（恢复的缩放范围与绘制前一致）
+        self._last_view_fingerprint = fingerprint
+
+        log_debug(f"视图 {current_mode} 绘制完成")
 
     def plot_complete_structure(self):
         """绘制完整能带结构 - 学术标准"""
@@ -524,7 +571,7 @@ class InteractivePlotWidget(QWidget):
 
         # 设置图形样式
         plt.style.use('default')  # 重置样式
-        self.figure.clear()
+        ax = self._prepare_axes()
 
         # 设置背景颜色
         if self.plot_settings.get('background_color') == 'black':
@@ -534,9 +581,6 @@ class InteractivePlotWidget(QWidget):
             self.figure.patch.set_facecolor('white')
             text_color = 'black'
 
-        # 创建子图
-        ax = self.figure.add_subplot(111)
-
         # 设置字体和样式
         title_fontsize = self.plot_settings.get('title_fontsize', 16)
         label_fontsize = self.plot_settings.get('label_fontsize', 14)
@@ -544,14 +588,7 @@ class InteractivePlotWidget(QWidget):
 
         # 绘制能带骨架
         if self.plot_settings.get('show_band_lines', True):
-            for band_idx in range(self.visualizer.num_bands):
-                band_energies = self.visualizer.band_energies[:, band_idx]
-                ax.plot(self.visualizer.k_points, band_energies,
-                       color=self.plot_settings['band_line_color'],
-                       linewidth=self.plot_settings['band_line_width'],
-                       alpha=self.plot_settings['band_line_alpha'],
-                       linestyle=self.plot_settings['band_line_style'],
-                       zorder=1)
+            self._draw_band_lines(ax)
 
         # 绘制轨道权重
         # 如果是费米专注模式，传递费米窗口的能量范围
@@ -567,12 +604,10 @@ class InteractivePlotWidget(QWidget):
         # 添加费米能级
         fermi_energy = self.plot_settings.get('fermi_energy', 0.0)
         if self.plot_settings.get('show_fermi_line', True):
-            ax.axhline(y=fermi_energy,
-                      color=self.plot_settings['fermi_line_color'],
-                      linestyle=self.plot_settings['fermi_line_style'],
-                      linewidth=self.plot_settings['fermi_line_width'],
-                      alpha=self.plot_settings['fermi_line_alpha'],
-                      zorder=3, label='Fermi level')
+            self._draw_fermi_line(ax, fermi_energy)
+
+        # 按本次显示的数据重新计算坐标范围
+        self._autoscale_to_data(ax)
 
         # 设置图形属性
         ax.set_xlabel(self.plot_settings['xlabel'], fontsize=label_fontsize, fontweight='bold', color=text_color)
@@ -603,7 +638,7 @@ class InteractivePlotWidget(QWidget):
 
         # 设置图形样式
         plt.style.use('default')  # 重置样式
-        self.figure.clear()
+        ax = self._prepare_axes()
 
         # 设置背景颜色
         if self.plot_settings.get('background_color') == 'black':
@@ -613,9 +648,6 @@ class InteractivePlotWidget(QWidget):
             self.figure.patch.set_facecolor('white')
             text_color = 'black'
 
-        # 创建子图
-        ax = self.figure.add_subplot(111)
-
         # 设置字体和样式
         title_fontsize = self.plot_settings.get('title_fontsize', 16)
         label_fontsize = self.plot_settings.get('label_fontsize', 14)
@@ -631,29 +663,17 @@ class InteractivePlotWidget(QWidget):
 
         # 绘制能带骨架 (只绘制窗口内的部分)
         if self.plot_settings.get('show_band_lines', True):
-            for band_idx in range(self.visualizer.num_bands):
-                band_energies = self.visualizer.band_energies[:, band_idx]
-
-                # 检查该能带是否在窗口内
-                if np.max(band_energies) >= y_min and np.min(band_energies) <= y_max:
-                    ax.plot(self.visualizer.k_points, band_energies,
-                           color=self.plot_settings['band_line_color'],
-                           linewidth=self.plot_settings['band_line_width'],
-                           alpha=self.plot_settings['band_line_alpha'],
-                           linestyle=self.plot_settings['band_line_style'],
-                           zorder=1)
+            self._draw_band_lines(ax, y_min, y_max)
 
         # 绘制轨道权重 (只绘制窗口内的部分)
         self._plot_orbital_weights(ax, energy_range=[y_min, y_max])
 
         # 添加费米能级
         if self.plot_settings.get('show_fermi_line', True):
-            ax.axhline(y=fermi_energy,
-                      color=self.plot_settings['fermi_line_color'],
-                      linestyle=self.plot_settings['fermi_line_style'],
-                      linewidth=self.plot_settings['fermi_line_width'],
-                      alpha=self.plot_settings['fermi_line_alpha'],
-                      zorder=3, label='Fermi level')
+            self._draw_fermi_line(ax, fermi_energy)
+
+        # 按本次显示的数据重新计算X轴范围（Y轴随后固定为费米窗口）
+        self._autoscale_to_data(ax)
 
         # 设置图形属性
         ax.set_xlabel(self.plot_settings['xlabel'], fontsize=label_fontsize, fontweight='bold', color=text_color)
@@ -697,14 +717,39 @@ class InteractivePlotWidget(QWidget):
     # 删除了水印相关方法
 
     def _apply_advanced_settings(self, ax, text_color, tick_fontsize):
-        """应用高级绘图设置"""
+        """应用高级绘图设置
+
+        坐标轴在重绘之间复用，设置值与上次相同时跳过（刻度、框线与标签位置仍保持上次的状态）。
+        """
+        settings = self.plot_settings
         # 刻度线设置
-        tick_direction = self.plot_settings.get('tick_direction', 'in')
-        tick_width = self.plot_settings.get('tick_width', 1.0)
-        tick_length = self.plot_settings.get('tick_length', 4.0)  # 新增：用户可自定义刻度线长度
-        show_ticks = self.plot_settings.get('show_ticks', True)
-        tick_label_fontsize = self.plot_settings.get('tick_label_fontsize', 12)
-        tick_label_weight = self.plot_settings.get('tick_label_weight', 'normal')
+        tick_direction = settings.get('tick_direction', 'in')
+        tick_width = settings.get('tick_width', 1.0)
+        tick_length = settings.get('tick_length', 4.0)  # 新增：用户可自定义刻度线长度
+        show_ticks = settings.get('show_ticks', True)
+        tick_label_fontsize = settings.get('tick_label_fontsize', 12)
+        tick_label_weight = settings.get('tick_label_weight', 'normal')
+
+        # 框线设置
+        frame_width = settings.get('frame_width', 1.0)
+        frame_top = settings.get('frame_top', True)
+        frame_bottom = settings.get('frame_bottom', True)
+        frame_left = settings.get('frame_left', True)
+        frame_right = settings.get('frame_right', True)
+
+        # 坐标轴标签设置
+        xlabel_position = settings.get('xlabel_position', 'bottom')
+        ylabel_position = settings.get('ylabel_position', 'left')
+        xlabel_pad = settings.get('xlabel_pad', 10)  # 新增：X轴标签距离
+        ylabel_pad = settings.get('ylabel_pad', 10)  # 新增：Y轴标签距离
+
+        state = (ax, (text_color, tick_fontsize, tick_direction, tick_width, tick_length, show_ticks,
+                      tick_label_fontsize, tick_label_weight, frame_width, frame_top, frame_bottom,
+                      frame_left, frame_right, xlabel_position, ylabel_position, xlabel_pad, ylabel_pad))
+        previous = self._advanced_settings_state
+        if previous is not None and previous[0] is ax and previous[1] == state[1]:
+            return
+        self._advanced_settings_state = state
 
         if show_ticks:
             ax.tick_params(axis='both', which='major',
@@ -719,13 +764,6 @@ class InteractivePlotWidget(QWidget):
                           colors=text_color,
                           length=0)  # 隐藏刻度线
 
-        # 框线设置
-        frame_width = self.plot_settings.get('frame_width', 1.0)
-        frame_top = self.plot_settings.get('frame_top', True)
-        frame_bottom = self.plot_settings.get('frame_bottom', True)
-        frame_left = self.plot_settings.get('frame_left', True)
-        frame_right = self.plot_settings.get('frame_right', True)
-
         # 设置框线可见性和宽度
         for spine_name, visible in [('top', frame_top), ('bottom', frame_bottom),
                                    ('left', frame_left), ('right', frame_right)]:
@@ -734,12 +772,6 @@ class InteractivePlotWidget(QWidget):
             if visible:
                 spine.set_linewidth(frame_width)
 
-        # 坐标轴标签设置
-        xlabel_position = self.plot_settings.get('xlabel_position', 'bottom')
-        ylabel_position = self.plot_settings.get('ylabel_position', 'left')
-        xlabel_pad = self.plot_settings.get('xlabel_pad', 10)  # 新增：X轴标签距离
-        ylabel_pad = self.plot_settings.get('ylabel_pad', 10)  # 新增：Y轴标签距离
-
         # 设置坐标轴标签位置
         if xlabel_position == 'top':
             ax.xaxis.set_label_position('top')
@@ -759,10 +791,10 @@ class InteractivePlotWidget(QWidget):
         ax.xaxis.labelpad = xlabel_pad
         ax.yaxis.labelpad = ylabel_pad
 
-        print(f"应用高级设置: 刻度线方向={tick_direction}, 宽度={tick_width}, 长度={tick_length}, 显示={show_ticks}")
-        print(f"框线设置: 上={frame_top}, 下={frame_bottom}, 左={frame_left}, 右={frame_right}, 宽度={frame_width}")
-        print(f"标签设置: 字体={tick_label_fontsize}, 粗细={tick_label_weight}, X位置={xlabel_position}, Y位置={ylabel_position}")
-        print(f"标签距离: X轴={xlabel_pad}, Y轴={ylabel_pad}")
+        log_debug(f"应用高级设置: 刻度线方向={tick_direction}, 宽度={tick_width}, 长度={tick_length}, 显示={show_ticks}")
+        log_debug(f"框线设置: 上={frame_top}, 下={frame_bottom}, 左={frame_left}, 右={frame_right}, 宽度={frame_width}")
+        log_debug(f"标签设置: 字体={tick_label_fontsize}, 粗细={tick_label_weight}, X位置={xlabel_position}, Y位置={ylabel_position}")
+        log_debug(f"标签距离: X轴={xlabel_pad}, Y轴={ylabel_pad}")
 
     def _plot_orbital_weights(self, ax, energy_range=None):
         """绘制轨道权重 - 性能优化版本"""
@@ -781,13 +813,13 @@ class InteractivePlotWidget(QWidget):
         max_points_per_orbital = self.plot_settings.get('max_points_per_orbital', 1000)
         use_fast_rendering = self.plot_settings.get('use_fast_rendering', True)
 
-        print(f"开始绘制轨道权重，阈值: {weight_threshold}, 最大点数: {max_points_per_orbital}")
+        log_debug(f"开始绘制轨道权重，阈值: {weight_threshold}, 最大点数: {max_points_per_orbital}")
 
         # 检查是否启用多核处理
         use_multiprocessing = self.plot_settings.get('use_multiprocessing', True)
 
         total_orbitals = len(self.visualizer.orbital_info)
-        print(f"总轨道数: {total_orbitals}, 多核处理: {use_multiprocessing}")
+        log_debug(f"总轨道数: {total_orbitals}, 多核处理: {use_multiprocessing}")
 
         if use_multiprocessing and total_orbitals > 4:
             # 使用多核处理
@@ -802,98 +834,260 @@ class InteractivePlotWidget(QWidget):
                                                 min_point_size, max_point_size,
                                                 max_points_per_orbital)
 
+    def _get_bands_t(self):
+        """获取按能带存储的能量数组 (nbands, nk)，连续 float32（按可视化器缓存）
+
+        每条能带为一行连续数据，按能带切片时无需跨步读取或复制。
+        """
+        bands_t = getattr(self.visualizer, '_bands_t', None)
+        if bands_t is None:
+            bands_t = np.ascontiguousarray(self.visualizer.band_energies.T, dtype=np.float32)
+            self.visualizer._bands_t = bands_t
+        return bands_t
+
+    def _get_band_segments(self):
+        """获取能带折线数据（按可视化器缓存）
+
+        返回 (segments, band_min, band_max)：segments 形状为 (nbands, nk, 2) 的连续
+        float32 数组，每条能带为一行连续的 (k, E) 折线；band_min/band_max 为各能带的能量范围。
+        """
+        entry = getattr(self.visualizer, '_band_segments', None)
+        if entry is None:
+            bands_t = self._get_bands_t()
+            k_points = np.broadcast_to(np.asarray(self.visualizer.k_points, dtype=np.float32), bands_t.shape)
+            segments = np.stack((k_points, bands_t), axis=-1)
+            entry = (segments, bands_t.min(axis=1), bands_t.max(axis=1))
+            self.visualizer._band_segments = entry
+        return entry
+
+    def _prepare_axes(self):
+        """获取持久坐标轴
+
+        首次绘制（或坐标轴已不在图中）时清空图形并新建坐标轴；之后直接复用，
+        并先隐藏上次的数据图元与图例，由本次绘制按需更新后重新显示。
+        """
+        ax = self._axes
+        if ax is None or ax not in self.figure.axes:
+            self.figure.clear()
+            ax = self.figure.add_subplot(111)
+            self._axes = ax
+            return ax
+
+        for artist in (self._band_lines, self._orbital_collection, self._fermi_line):
+            if artist is not None:
+                artist.set_visible(False)
+        if ax.get_legend() is not None:
+            ax.get_legend().remove()
+        return ax
+
+    def _autoscale_to_data(self, ax):
+        """按可见图元重新计算数据范围并自动缩放
+
+        relim() 不统计集合（Collection），能带线与散点的范围另行并入。
+        """
+        ax.relim(visible_only=True)
+        for artist in (self._band_lines, self._orbital_collection):
+            if artist is not None and artist.get_visible() and artist.axes is ax:
+                points = artist.get_datalim(ax.transData).get_points()
+                if np.all(np.isfinite(points)):
+                    ax.update_datalim(points)
+        ax.set_autoscale_on(True)
+        ax.autoscale_view()
+
+    def _draw_band_lines(self, ax, y_min=None, y_max=None):
+        """以单个 LineCollection 绘制所有能带骨架；给定能量窗口时只绘制与窗口相交的能带
+
+        LineCollection 在坐标轴上持久保留，重绘时只替换线段与样式。
+        """
+        segments, band_min, band_max = self._get_band_segments()
+        if y_min is not None:
+            segments = segments[(band_max >= y_min) & (band_min <= y_max)]
+        if len(segments) == 0:
+            return None
+
+        lines = self._band_lines
+        if lines is None or lines.axes is not ax:
+            lines = LineCollection(segments, zorder=1)
+            ax.add_collection(lines, autolim=False)
+            self._band_lines = lines
+        else:
+            lines.set_segments(segments)
+        lines.set_color(self.plot_settings['band_line_color'])
+        lines.set_linewidth(self.plot_settings['band_line_width'])
+        lines.set_alpha(self.plot_settings['band_line_alpha'])
+        lines.set_linestyle(self.plot_settings['band_line_style'])
+        lines.set_visible(True)
+        return lines
+
+    def _draw_fermi_line(self, ax, fermi_energy):
+        """绘制费米能级水平线，持久保留，重绘时只更新位置与样式"""
+        line = self._fermi_line
+        if line is None or line.axes is not ax:
+            line = ax.axhline(y=fermi_energy, zorder=3, label='Fermi level')
+            self._fermi_line = line
+        else:
+            line.set_ydata([fermi_energy, fermi_energy])
+        line.set_color(self.plot_settings['fermi_line_color'])
+        line.set_linestyle(self.plot_settings['fermi_line_style'])
+        line.set_linewidth(self.plot_settings['fermi_line_width'])
+        line.set_alpha(self.plot_settings['fermi_line_alpha'])
+        line.set_visible(True)
+        return line
+
+    def _get_band_order(self):
+        """获取各能带按能量排序的 k 点下标（按可视化器缓存）
+
+        返回 (order, sorted_energies)，形状均为 (nbands, nk)：order[b] 为第 b 条能带
+        按能量升序排列的 k 点下标，sorted_energies[b] 为对应的能量。
+        """
+        entry = getattr(self.visualizer, '_band_order', None)
+        if entry is None:
+            bands_t = self._get_bands_t()
+            order = np.argsort(bands_t, axis=1, kind='stable')
+            entry = (order, np.take_along_axis(bands_t, order, axis=1))
+            self.visualizer._band_order = entry
+        return entry
+
+    def _get_energy_window(self, energy_range):
+        """获取能量窗口内各能带的 k 点范围
+
+        返回 (order, lo, hi)：第 b 条能带落在窗口内的 k 点下标为 order[b, lo[b]:hi[b]]，
+        hi > lo 表示该能带有点落在窗口内。每条能带只做两次二分查找，不扫描整个能量数组。
+        """
+        order, sorted_energies = self._get_band_order()
+        num_bands = sorted_energies.shape[0]
+        lo = np.empty(num_bands, dtype=np.intp)
+        hi = np.empty(num_bands, dtype=np.intp)
+        for band_idx in range(num_bands):
+            row = sorted_energies[band_idx]
+            lo[band_idx] = np.searchsorted(row, energy_range[0], side='left')
+            hi[band_idx] = np.searchsorted(row, energy_range[1], side='right')
+        return order, lo, hi
+
+    def _get_valid_indices(self):
+        """获取每个轨道校验后的权重列索引（np.intp 数组，按可视化器缓存）"""
+        valid_index_map = getattr(self.visualizer, '_valid_indices', None)
+        if valid_index_map is None:
+            max_weight_index = self.visualizer.band_weights.shape[2] - 1
+            valid_index_map = {
+                orbital_key: np.asarray([idx for idx in (indices or []) if 0 <= idx <= max_weight_index],
+                                        dtype=np.intp)
+                for orbital_key, indices in self.visualizer.orbital_info.items()
+            }
+            self.visualizer._valid_indices = valid_index_map
+        return valid_index_map
+
+    def _get_orbital_weights(self, orbital_keys):
+        """获取各轨道在所有能带上的总权重（按可视化器缓存）
+
+        返回与 orbital_keys 对应的列表，每项为按能带连续存储的 (nbands, nk) 数组。
+        轨道须有有效的权重列；缓存中没有的轨道一次性批量计算（CSR 形式: offsets/indices）。
+        权重只随数据变化，切换轨道可见性、缩放或修改绘图设置时直接复用。
+        """
+        cache = getattr(self.visualizer, '_orbital_weight_cache', None)
+        if cache is None:
+            cache = {}
+            self.visualizer._orbital_weight_cache = cache
+
+        missing = [orbital_key for orbital_key in orbital_keys if orbital_key not in cache]
+        if missing:
+            valid_index_map = self._get_valid_indices()
+            index_arrays = [valid_index_map[orbital_key] for orbital_key in missing]
+            offsets = np.zeros(len(index_arrays) + 1, dtype=np.intp)
+            np.cumsum([len(arr) for arr in index_arrays], out=offsets[1:])
+            # 进程内计算（numba 可用时多线程并行，无需序列化）
+            sums = compute_orbital_weights(self.visualizer.band_weights, offsets,
+                                           np.concatenate(index_arrays))
+            for orbital_key, orbital_sums in zip(missing, sums):
+                cache[orbital_key] = np.ascontiguousarray(orbital_sums.T)
+        return [cache[orbital_key] for orbital_key in orbital_keys]
+
     def _plot_orbital_weights_multicore(self, ax, energy_range, weight_threshold,
                                       point_size_factor, point_alpha, min_point_size,
                                       max_point_size, max_points_per_orbital):
         """多核绘制轨道权重"""
-        print("使用多核处理绘制轨道权重...")
+        log_debug("使用多核处理绘制轨道权重...")
 
-        # 准备轨道数据列表
-        orbital_data_list = []
-        for orbital_key, indices in self.visualizer.orbital_info.items():
+        # 需要处理的能带：有能量窗口时只取窗口内有点的能带
+        if energy_range:
+            _, lo, hi = self._get_energy_window(energy_range)
+            band_indices = np.flatnonzero(hi > lo)
+        else:
+            band_indices = range(self.visualizer.num_bands)
+
+        # 收集有有效权重列的可见轨道
+        valid_index_map = self._get_valid_indices()
+        orbital_keys = []
+        for orbital_key in self.visualizer.orbital_info:
             # 检查轨道可见性
             if not self.visible_orbitals.get(orbital_key, True):
                 continue
 
-            if not indices or len(indices) == 0:
+            valid_indices = valid_index_map.get(orbital_key)
+            if valid_indices is None or len(valid_indices) == 0:
                 continue
 
-            # 为每个能带准备数据
-            for band_idx in range(self.visualizer.num_bands):
-                band_energies = self.visualizer.band_energies[:, band_idx]
-
-                # 能量范围过滤
-                if energy_range:
-                    if np.max(band_energies) < energy_range[0] or np.min(band_energies) > energy_range[1]:
-                        continue
-
-                # 计算轨道权重
-                try:
-                    max_weight_index = self.visualizer.band_weights.shape[2] - 1
-                    valid_indices = [idx for idx in indices if 0 <= idx <= max_weight_index]
-
-                    if not valid_indices:
-                        continue
+            orbital_keys.append(orbital_key)
 
-                    orbital_weights = np.sum(self.visualizer.band_weights[:, band_idx, :][:, valid_indices], axis=1)
+        if not orbital_keys:
+            return
 
-                    # 准备数据
-                    settings = {
-                        'weight_threshold': weight_threshold,
-                        'max_points_per_orbital': max_points_per_orbital,
-                        'energy_range': energy_range
-                    }
+        # 准备数据
+        settings = {
+            'weight_threshold': weight_threshold,
+            'max_points_per_orbital': max_points_per_orbital,
+            'energy_range': energy_range
+        }
 
+        try:
+            # 各可见轨道的权重和（缓存，只计算首次出现的轨道）
+            weights_t = self._get_orbital_weights(orbital_keys)
+
+            # 按能带连续存储（SoA）：每个轨道-能带组合的能量与权重都是连续的行视图，
+            # k 点数组所有组合共用，无需逐个复制
+            k_points = np.ascontiguousarray(self.visualizer.k_points, dtype=np.float32)
+            bands_t = self._get_bands_t()
+
+            # 为每个轨道-能带组合准备数据
+            orbital_data_list = []
+            for orbital_id, orbital_key in enumerate(orbital_keys):
+                for band_idx in band_indices:
                     orbital_data_list.append((
                         f"{orbital_key}_band_{band_idx}",
-                        self.visualizer.k_points.copy(),
-                        band_energies.copy(),
-                        orbital_weights.copy(),
+                        k_points,
+                        bands_t[band_idx],
+                        weights_t[orbital_id][band_idx],
                         settings
                     ))
 
-                except (IndexError, ValueError):
-                    continue
+            log_debug(f"准备处理 {len(orbital_data_list)} 个轨道-能带组合")
 
-        if not orbital_data_list:
-            return
-
-        print(f"准备处理 {len(orbital_data_list)} 个轨道-能带组合")
-
-        # 多核处理
-        try:
+            # 线程后端：进程内分批并行，数组按引用共享
             processed_results = self.multicore_processor.process_orbitals_parallel(
-                orbital_data_list, process_single_orbital,
-                max_workers=min(4, len(orbital_data_list))  # 限制最大工作进程数
-            )
+                orbital_data_list, process_single_orbital, backend='thread')
 
-            # 绘制结果
+            # 按轨道汇总结果
+            orbital_points = {}
             for result in processed_results:
                 if result is None:
                     continue
 
                 orbital_key = result['orbital_key'].split('_band_')[0]
-                color = self.visualizer.orbital_colors.get(orbital_key, '#95A5A6')
 
                 k_filtered = result['k_points']
                 e_filtered = result['energies']
                 w_filtered = result['weights']
 
                 if len(k_filtered) > 0:
-                    # 计算点大小
-                    w_max = np.max(w_filtered)
-                    if w_max > 0:
-                        w_normalized = w_filtered / w_max
-                        point_sizes = (min_point_size +
-                                     w_normalized * (max_point_size - min_point_size) * point_size_factor)
-                    else:
-                        point_sizes = np.ones_like(w_filtered) * min_point_size
+                    orbital_points.setdefault(orbital_key, []).append((k_filtered, e_filtered, w_filtered))
 
-                    # 直接绘制散点
-                    ax.scatter(k_filtered, e_filtered, s=point_sizes, c=color,
-                             alpha=point_alpha, edgecolors='none', zorder=2)
+            # 所有轨道合并为一个散点集合
+            self._draw_orbital_points(ax, [
+                (self.visualizer.orbital_colors.get(orbital_key, '#95A5A6'), chunks)
+                for orbital_key, chunks in orbital_points.items()
+            ], point_alpha, (min_point_size, max_point_size, point_size_factor))
 
-            print(f"多核处理完成，绘制了 {len([r for r in processed_results if r is not None])} 个轨道")
+            log_debug(f"多核处理完成，绘制了 {len(orbital_points)} 个轨道")
 
         except Exception as e:
             print(f"多核处理失败，回退到单核: {e}")
@@ -906,94 +1100,123 @@ class InteractivePlotWidget(QWidget):
                                        point_size_factor, point_alpha, min_point_size,
                                        max_point_size, max_points_per_orbital):
         """单核绘制轨道权重（原有逻辑）"""
-        print("使用单核处理绘制轨道权重...")
+        log_debug("使用单核处理绘制轨道权重...")
 
         total_orbitals = len(self.visualizer.orbital_info)
         processed_orbitals = 0
 
+        # 需要绘制的能带：有能量窗口时只取窗口内有点的能带（各能带窗口内的 k 点范围见 lo/hi）
+        if energy_range:
+            order, lo, hi = self._get_energy_window(energy_range)
+            band_indices = np.flatnonzero(hi > lo)
+        else:
+            band_indices = range(self.visualizer.num_bands)
+
+        # 与能带/权重一致用 float32，过滤后的散点数据全程单精度（数据已是 float32 时不复制）
+        k_points_all = np.asarray(self.visualizer.k_points, dtype=np.float32)
+        bands_t = self._get_bands_t()
+        valid_index_map = self._get_valid_indices()
+
+        # 各轨道的 (颜色, 各能带数据块)，遍历完成后一次性绘制
+        orbital_batches = []
+
         # 遍历所有轨道
         for orbital_key, indices in self.visualizer.orbital_info.items():
             processed_orbitals += 1
             if processed_orbitals % 5 == 0:
-                print(f"处理进度: {processed_orbitals}/{total_orbitals} 轨道")
+                log_debug(f"处理进度: {processed_orbitals}/{total_orbitals} 轨道")
             # 检查轨道可见性
             if not self.visible_orbitals.get(orbital_key, True):
                 continue
 
-            # 检查indices是否有效
-            if not indices or len(indices) == 0:
+            # 预先校验过的权重列索引；没有有效列的轨道直接跳过
+            if not indices:
+                continue
+            valid_indices = valid_index_map.get(orbital_key)
+            if valid_indices is None or len(valid_indices) == 0:
                 continue
 
-
-
-            # 获取轨道颜色
+            # 获取轨道颜色（每个轨道一次，能带循环内只做数组运算）
             color = self.visualizer.orbital_colors.get(orbital_key, '#95A5A6')
 
             # 调试信息
-            if hasattr(self, '_debug_mode') and self._debug_mode:
+            if getattr(self, '_debug_mode', False):
                 print(f"绘制轨道: {orbital_key}, 权重索引: {indices}, 颜色: {color}")
 
-            # 遍历所有能带
-            for band_idx in range(self.visualizer.num_bands):
-                band_energies = self.visualizer.band_energies[:, band_idx]
-
-                # 如果指定了能量范围，检查该能带是否在范围内
-                if energy_range:
-                    if np.max(band_energies) < energy_range[0] or np.min(band_energies) > energy_range[1]:
-                        continue
-
-                # 计算轨道权重 - 确保索引正确
-                try:
-                    # 检查索引是否在有效范围内
-                    max_weight_index = self.visualizer.band_weights.shape[2] - 1
-                    valid_indices = [idx for idx in indices if 0 <= idx <= max_weight_index]
-
-                    if not valid_indices:
-                        continue
-
-                    # 计算该轨道的总权重
-                    orbital_weights = np.sum(self.visualizer.band_weights[:, band_idx, :][:, valid_indices], axis=1)
+            chunks = []
 
-                except (IndexError, ValueError) as e:
-                    print(f"警告: 轨道 {orbital_key} 权重计算失败: {e}")
-                    continue
+            # 该轨道在所有能带上的总权重 (nbands, nk)，按可视化器缓存
+            weights_t = self._get_orbital_weights([orbital_key])[0]
 
-                # 过滤显著权重
-                mask = orbital_weights > weight_threshold
-                if np.any(mask):
-                    k_filtered = self.visualizer.k_points[mask]
-                    e_filtered = band_energies[mask]
-                    w_filtered = orbital_weights[mask]
-
-                    # 如果指定了能量范围，进一步过滤
-                    if energy_range:
-                        range_mask = (e_filtered >= energy_range[0]) & (e_filtered <= energy_range[1])
-                        k_filtered = k_filtered[range_mask]
-                        e_filtered = e_filtered[range_mask]
-                        w_filtered = w_filtered[range_mask]
-
-                    if len(k_filtered) > 0:
-                        # 数据采样以提高性能
-                        if len(k_filtered) > max_points_per_orbital:
-                            # 智能采样：保留权重最大的点
-                            sample_indices = np.argsort(w_filtered)[-max_points_per_orbital:]
-                            k_filtered = k_filtered[sample_indices]
-                            e_filtered = e_filtered[sample_indices]
-                            w_filtered = w_filtered[sample_indices]
-
-                        # 计算点大小 - 使用更精确的缩放
-                        w_max = np.max(w_filtered)
-                        if w_max > 0:
-                            w_normalized = w_filtered / w_max
-                            point_sizes = (min_point_size +
-                                         w_normalized * (max_point_size - min_point_size) * point_size_factor)
-                        else:
-                            point_sizes = np.ones_like(w_filtered) * min_point_size
-
-                        # 直接绘制散点
-                        print(f"完整能带模式绘制数据点数: {len(k_filtered)}")
-                        ax.scatter(k_filtered, e_filtered, s=point_sizes, c=color,
-                                 alpha=point_alpha, edgecolors='none', zorder=2)
+            # 遍历需要绘制的能带
+            for band_idx in band_indices:
+                # 能量窗口内的 k 点（二分查找得到的连续切片），无窗口时取全部 k 点
+                if energy_range:
+                    k_idx = order[band_idx, lo[band_idx]:hi[band_idx]]
+                    orbital_weights = weights_t[band_idx, k_idx]
+                    band_energies = bands_t[band_idx, k_idx]
+                    k_points = k_points_all[k_idx]
+                else:
+                    orbital_weights = weights_t[band_idx]
+                    band_energies = bands_t[band_idx]
+                    k_points = k_points_all
+
+                # 过滤显著权重，并只保留权重最大的点以提高性能
+                sample_indices = filter_topk(orbital_weights, weight_threshold, max_points_per_orbital)
+                if len(sample_indices) > 0:
+                    k_filtered = k_points[sample_indices]
+                    e_filtered = band_energies[sample_indices]
+                    w_filtered = orbital_weights[sample_indices]
+
+                    # 点大小在绘制时对所有数据块一次性计算
+                    chunks.append((k_filtered, e_filtered, w_filtered))
+
+            if chunks:
+                orbital_batches.append((color, chunks))
+
+        total_points = sum(len(chunk[0]) for _, chunks in orbital_batches for chunk in chunks)
+        log_debug(f"单核处理完成，绘制数据点数: {total_points}")
+        self._draw_orbital_points(ax, orbital_batches, point_alpha,
+                                  (min_point_size, max_point_size, point_size_factor))
+
+    def _draw_orbital_points(self, ax, orbital_batches, point_alpha, size_range):
+        """将所有可见轨道的散点合并为一个 PathCollection 绘制
+
+        orbital_batches 为 [(颜色, [(k, e, weights), ...]), ...]，按轨道顺序拼接，
+        后面的轨道仍覆盖在前面的轨道之上。size_range 为 (最小点, 最大点, 缩放因子)，
+        各数据块按自身最大权重归一化，拼接后一次性换算为点大小。颜色按点展开为 RGBA 数组；
+        持久集合只更新偏移、大小和颜色，不再为每个轨道各建一个散点集合。
+        """
+        if not orbital_batches:
+            return None
+
+        chunks = [chunk for _, orbital_chunks in orbital_batches for chunk in orbital_chunks]
+        k_points, energies, weights = (np.concatenate(parts) for parts in zip(*chunks))
+        point_sizes = chunked_weight_to_size(weights, [len(chunk[2]) for chunk in chunks], *size_range)
+        counts = [sum(len(chunk[0]) for chunk in orbital_chunks) for _, orbital_chunks in orbital_batches]
+        face_colors = np.repeat(to_rgba_array([color for color, _ in orbital_batches]), counts, axis=0)
+
+        rasterized = self.plot_settings.get('rasterize_scatter', True)
+
+        collection = self._orbital_collection
+        if collection is not None:
+            collection.set_offsets(np.column_stack((k_points, energies)))
+            collection.set_sizes(point_sizes)
+            collection.set_facecolors(face_colors)
+            collection.set_alpha(point_alpha)
+            collection.set_rasterized(rasterized)
+            collection.set_visible(True)
+            if collection.axes is not ax:
+                # figure.clear() 后集合已与旧坐标轴解除关联，重新绑定变换与裁剪区域
+                collection.set_offset_transform(ax.transData)
+                collection.set_clip_path(ax.patch)
+                ax.add_collection(collection, autolim=False)
+        else:
+            collection = ax.scatter(k_points, energies, s=point_sizes, c=face_colors,
+                                    alpha=point_alpha, edgecolors='none',
+                                    rasterized=rasterized, zorder=2)
+            self._orbital_collection = collection
+        return collection
 
     # 删除了插值相关的绘制方法
 
@@ -1002,20 +1225,17 @@ class InteractivePlotWidget(QWidget):
         if len(k_points) <= 1:
             return np.arange(len(k_points))
 
-        unique_indices = [0]  # 第一个点总是唯一的
-
-        for i in range(1, len(k_points)):
-            # 检查当前点是否与之前的点重复
-            is_duplicate = False
-            for j in unique_indices:
-                if abs(k_points[i] - k_points[j]) < tolerance:
-                    is_duplicate = True
-                    break
+        k_points = np.asarray(k_points)
 
-            if not is_duplicate:
-                unique_indices.append(i)
+        # 容差近似为零：直接按值去重（保留首次出现的索引）
+        if tolerance <= np.finfo(k_points.dtype).eps * 10:
+            _, idx = np.unique(k_points, return_index=True)
+            return np.sort(idx)
 
-        return np.array(unique_indices)
+        # 非零容差：排序后相邻差值小于容差的点归为一组，每组保留最小原始索引
+        order = np.argsort(k_points, kind='stable')
+        group_starts = np.flatnonzero(np.r_[True, np.diff(k_points[order]) >= tolerance])
+        return np.sort(np.minimum.reduceat(order, group_starts))
 
     def _find_continuous_segments(self, k_points, max_gap=0.1):
         """找到k点的连续段 - 改进版本"""
@@ -1037,25 +1257,15 @@ class InteractivePlotWidget(QWidget):
         else:
             adaptive_gap = max_gap
 
+        # 常见情况：没有任何间隙超过阈值，整条路径即为一段
+        if not np.any(k_diffs > adaptive_gap):
+            return [sorted_indices]
+
         # 找到不连续的点
         breaks = np.where(k_diffs > adaptive_gap)[0]
 
-        # 构建段索引（基于排序后的索引）
-        segments = []
-        start = 0
-
-        for b in breaks:
-            if b + 1 > start:  # 确保段有效
-                segment_indices = sorted_indices[start:b+1]
-                if len(segment_indices) >= 2:  # 只保留有足够点的段
-                    segments.append(segment_indices)
-            start = b + 1
-
-        # 添加最后一段
-        if start < len(sorted_indices):
-            segment_indices = sorted_indices[start:]
-            if len(segment_indices) >= 2:
-                segments.append(segment_indices)
+        # 按间隙一次切分排序后的索引，只保留有足够点的段
+        segments = [segment for segment in np.split(sorted_indices, breaks + 1) if len(segment) >= 2]
 
         # 如果没有找到有效段，返回整个数组作为一段
         if not segments and len(k_points) >= 2:
@@ -1065,90 +1275,73 @@ class InteractivePlotWidget(QWidget):
 
     def _add_legend(self, ax):
         """添加学术标准图例"""
+        # 设置与映射只取一次，后续使用局部变量
+        plot_settings = self.plot_settings
+        legend_settings = self.legend_settings
+        orbital_colors = self.visualizer.orbital_colors
+        visible_orbitals = self.visible_orbitals
+
         # 创建图例元素
         legend_elements = []
 
-        # 按元素分组显示轨道
-        elements = set()
+        # 按元素分组显示轨道：一次遍历建立 元素 -> 轨道列表
+        element_orbitals_map = {}
         for orbital_key in self.visualizer.orbital_info.keys():
-            element = orbital_key.split('_')[0]
-            elements.add(element)
-
-        # 按元素和轨道类型排序
-        orbital_order = ['s', 'p', 'd', 'f']
+            element, sep, _ = orbital_key.partition('_')
+            if sep:
+                element_orbitals_map.setdefault(element, []).append(orbital_key)
 
-        for element in sorted(elements):
-            element_orbitals = []
-            for orbital_key in self.visualizer.orbital_info.keys():
-                if orbital_key.startswith(element + '_'):
-                    element_orbitals.append(orbital_key)
-
-            # [Fix 20250825] 图例元素内排序：按 ℓ(s<p<d<f) → n 升序 → 原串
-            def legend_sort_key(orbital_key):
-                # 提取类型部分（可能是 nℓ 或仅 ℓ）
-                type_part = orbital_key.split('_', 1)[1] if '_' in orbital_key else orbital_key
-
-                # 提取 ℓ 字母（最后一位在 spdf）
-                l_letter = type_part[-1] if (type_part and type_part[-1] in ['s', 'p', 'd', 'f']) else ''
-
-                # 提取 n（去掉最后一位的数字部分），无 n 时用 -1 提前显示
-                n_part = type_part[:-1] if (len(type_part) > 1 and l_letter) else ''
-                try:
-                    n_val = int(n_part) if n_part != '' else -1
-                except Exception:
-                    n_val = 10**9  # 非法 n 放到最后
-
-                l_priority = {'s': 0, 'p': 1, 'd': 2, 'f': 3}.get(l_letter, 999)
-                return (l_priority, n_val, type_part)
+        # [Fix 20250825] 图例元素内排序：按 ℓ(s<p<d<f) → n 升序 → 原串
+        def legend_sort_key(orbital_key):
+            # 提取类型部分（可能是 nℓ 或仅 ℓ），解析结果按类型串缓存
+            return _parse_orbital_type(orbital_key.split('_', 1)[1])
 
+        for element in sorted(element_orbitals_map):
+            element_orbitals = element_orbitals_map[element]
             element_orbitals.sort(key=legend_sort_key)
 
             for orbital_key in element_orbitals:
-                if self.visible_orbitals.get(orbital_key, True):
-                    color = self.visualizer.orbital_colors.get(orbital_key, '#95A5A6')
+                if visible_orbitals.get(orbital_key, True):
+                    color = orbital_colors.get(orbital_key, '#95A5A6')
 
                     # 格式化标签 - 学术标准格式
                     element_part, orbital_part = orbital_key.split('_')
                     formatted_label = f"{element_part} {orbital_part}"
 
-                    legend_elements.append(plt.Line2D([0], [0], marker='o', color='w',
-                                                    markerfacecolor=color, markersize=8,
-                                                    markeredgecolor='black', markeredgewidth=0.5,
-                                                    label=formatted_label))
+                    legend_elements.append(_legend_marker_proxy(formatted_label, color))
 
         # 添加费米能级图例
-        if self.plot_settings.get('show_fermi_line', True):
-            legend_elements.append(plt.Line2D([0], [0],
-                                            color=self.plot_settings['fermi_line_color'],
-                                            linestyle=self.plot_settings['fermi_line_style'],
-                                            linewidth=self.plot_settings['fermi_line_width'],
-                                            alpha=self.plot_settings['fermi_line_alpha'],
-                                            label='Fermi level'))
+        if plot_settings.get('show_fermi_line', True):
+            legend_elements.append(_legend_line_proxy('Fermi level',
+                                                      plot_settings['fermi_line_color'],
+                                                      plot_settings['fermi_line_style'],
+                                                      plot_settings['fermi_line_width'],
+                                                      plot_settings['fermi_line_alpha']))
 
         # 添加能带线图例
-        if self.plot_settings.get('show_band_lines', True):
-            legend_elements.append(plt.Line2D([0], [0],
-                                            color=self.plot_settings['band_line_color'],
-                                            linestyle=self.plot_settings['band_line_style'],
-                                            linewidth=self.plot_settings['band_line_width'],
-                                            alpha=self.plot_settings['band_line_alpha'],
-                                            label='Band structure'))
+        if plot_settings.get('show_band_lines', True):
+            legend_elements.append(_legend_line_proxy('Band structure',
+                                                      plot_settings['band_line_color'],
+                                                      plot_settings['band_line_style'],
+                                                      plot_settings['band_line_width'],
+                                                      plot_settings['band_line_alpha']))
 
         if legend_elements:
             # 创建可拖动和自定义的图例
             legend = ax.legend(handles=legend_elements,
-                             loc=self.legend_settings['location'],
-                             fontsize=self.legend_settings['fontsize'],
-                             frameon=self.legend_settings['frameon'],
-                             fancybox=self.legend_settings['fancybox'],
-                             shadow=self.legend_settings['shadow'],
-                             framealpha=self.legend_settings['framealpha'],
-                             edgecolor=self.legend_settings['edgecolor'],
-                             facecolor=self.legend_settings['facecolor'])
+                             loc=legend_settings['location'],
+                             fontsize=legend_settings['fontsize'],
+                             frameon=legend_settings['frameon'],
+                             fancybox=legend_settings['fancybox'],
+                             shadow=legend_settings['shadow'],
+                             framealpha=legend_settings['framealpha'],
+                             edgecolor=legend_settings['edgecolor'],
+                             facecolor=legend_settings['facecolor'])
             
             # 设置字体粗细
+            fontweight = legend_settings.get('fontweight', 'normal')
             for text in legend.get_texts():
-                text.set_fontweight(self.legend_settings.get('fontweight', 'normal'))
+                text.set_fontweight(fontweight)
 
             # 设置图例边框
             legend.get_frame().set_linewidth(0.8)
@@ -1167,6 +1360,7 @@ class InteractivePlotWidget(QWidget):
 
             return legend
 
+    @pyqtSlot(str, object)
     def toggle_orbital_visibility(self, orbital_key, visible):
         """切换轨道可见性"""
         # [Deprecated 20250827] 旧逻辑：处理 "CLEAR_CACHE" 指令已删除（缓存机制废弃）
@@ -1190,8 +1384,17 @@ class InteractivePlotWidget(QWidget):
         self.visible_orbitals[orbital_key] = visible
         self.plot_current_view()
 
+    @pyqtSlot(dict)
+    def set_orbitals_visibility(self, changes):
+        """批量切换轨道可见性（全选/全不选/反选），只重绘一次"""
+        if not changes:
+            return
+        self.visible_orbitals.update(changes)
+        self.plot_current_view()
 
 
+
+    @pyqtSlot(str)
     def set_view_mode(self, mode):
         """设置视图模式 - 支持双可视化器切换"""
         print(f"绘图组件接收到视图模式改变信号: {mode}")
@@ -1266,7 +1469,7 @@ class InteractivePlotWidget(QWidget):
 
             # 通知控制面板更新轨道信息
             if hasattr(self, 'control_panel_ref') and self.control_panel_ref:
-                self.control_panel_ref.set_orbitals(self.complete_visualizer)
+                self.control_panel_ref.set_orbitals(self.complete_visualizer, keep_checked=True)
 
         except Exception as e:
             print(f"创建完整能带可视化器失败: {e}")
@@ -1299,7 +1502,7 @@ class InteractivePlotWidget(QWidget):
 
             # 通知控制面板更新轨道信息
             if hasattr(self, 'control_panel_ref') and self.control_panel_ref:
-                self.control_panel_ref.set_orbitals(self.fermi_visualizer)
+                self.control_panel_ref.set_orbitals(self.fermi_visualizer, keep_checked=True)
 
         except Exception as e:
             print(f"创建费米专注可视化器失败: {e}")
@@ -1309,6 +1512,7 @@ class InteractivePlotWidget(QWidget):
             print("回退到完整能带可视化器")
             self._switch_to_complete_visualizer()
 
+    @pyqtSlot(dict)
     def update_plot_settings(self, settings):
         """更新绘图设置 - 全局生效于所有视图模式"""
         self.plot_settings.update(settings)
@@ -1338,16 +1542,46 @@ class InteractivePlotWidget(QWidget):
             if event.key == 'shift':  # Shift+左键开始框选
                 self.zoom_mode = True
                 self.zoom_start = (event.xdata, event.ydata)
+                self._start_zoom_rect(event.inaxes, event.xdata, event.ydata)
                 print("开始框选放大模式")
 
     def on_mouse_move(self, event):
         """鼠标移动事件"""
-        if self.zoom_mode and event.inaxes:
-            # 更新框选矩形（这里可以添加实时显示框选框的代码）
-            pass
+        if self.zoom_mode and event.inaxes and self.zoom_rect is not None:
+            ax = event.inaxes
+            if self.zoom_rect.axes is not ax:
+                return
+            # 更新框选矩形：恢复静态背景后只重绘矩形（blit），不重绘能带与散点
+            x0, y0 = self.zoom_start
+            self.zoom_rect.set_bounds(x0, y0, event.xdata - x0, event.ydata - y0)
+            self.canvas.restore_region(self._zoom_background)
+            ax.draw_artist(self.zoom_rect)
+            self.canvas.blit(ax.bbox)
+
+    def _start_zoom_rect(self, ax, x, y):
+        """缓存坐标轴的静态背景并创建动画框选矩形"""
+        self._clear_zoom_rect()
+        self._zoom_background = self.canvas.copy_from_bbox(ax.bbox)
+        self.zoom_rect = Rectangle((x, y), 0, 0, fill=False, edgecolor='#2C3E50',
+                                   linestyle='--', linewidth=1.0, animated=True)
+        ax.add_patch(self.zoom_rect)
+
+    def _clear_zoom_rect(self):
+        """移除框选矩形，并用缓存的背景擦除其残影"""
+        rect, self.zoom_rect = self.zoom_rect, None
+        background, self._zoom_background = self._zoom_background, None
+        if rect is None or rect.axes is None:
+            return
+        ax = rect.axes
+        rect.remove()
+        if background is not None:
+            self.canvas.restore_region(background)
+            self.canvas.blit(ax.bbox)
 
     def on_mouse_release(self, event):
         """鼠标释放事件"""
+        if self.zoom_mode and event.button == 1:
+            self._clear_zoom_rect()
         if self.zoom_mode and event.button == 1 and event.inaxes:
             self.zoom_mode = False
             zoom_end = (event.xdata, event.ydata)
@@ -1378,13 +1612,7 @@ class InteractivePlotWidget(QWidget):
                 self.current_xlim = ax.get_xlim()
                 self.current_ylim = ax.get_ylim()
 
-            # 设置新的视图范围
-            ax.set_xlim(xmin, xmax)
-            ax.set_ylim(ymin, ymax)
-            self.is_zoomed = True
-
-            # 重新绘制当前视图
-            self.plot_current_view()
+            self._set_view_limits(ax, (xmin, xmax), (ymin, ymax), zoomed=True)
 
             print(f"缩放到区域: x=[{xmin:.2f}, {xmax:.2f}], y=[{ymin:.2f}, {ymax:.2f}]")
 
@@ -1407,12 +1635,28 @@ class InteractivePlotWidget(QWidget):
         if hasattr(self.figure, 'axes') and len(self.figure.axes) > 0:
             ax = self.figure.axes[0]
             if self.current_xlim and self.current_ylim and self.is_zoomed:
-                ax.set_xlim(self.current_xlim)
-                ax.set_ylim(self.current_ylim)
-                self.is_zoomed = False
-                self.plot_current_view()
+                self._set_view_limits(ax, self.current_xlim, self.current_ylim, zoomed=False)
                 print("已重置缩放")
 
+    def _set_view_limits(self, ax, xlim, ylim, zoomed):
+        """缩放/重置缩放：图形内容与坐标范围无关，已绘制的内容仍有效时只改范围并空闲重绘
+
+        内容已过期（数据或设置在上次绘制后有变化）时退回完整重绘。
+        费米专注模式与完整重绘时一致，只改变 X 轴范围，Y 轴保持费米窗口。
+        """
+        up_to_date = (self._last_view_fingerprint is not None
+                      and self._last_view_fingerprint == self._view_fingerprint())
+        ax.set_xlim(xlim)
+        if self.current_plot_type != "fermi":
+            ax.set_ylim(ylim)
+        self.is_zoomed = zoomed
+
+        if not up_to_date:
+            self.plot_current_view()
+            return
+        self._last_view_fingerprint = self._view_fingerprint()
+        self.canvas.draw_idle()
+
 # ============================================================================
 # 4. 控制面板模块 - 主要的GUI设置界面
 # ============================================================================
@@ -1422,28 +1666,111 @@ class ControlPanel(QWidget):
 
     # 修复信号定义，支持多种数据类型
     orbital_toggled = pyqtSignal(str, object)  # 使用object类型支持任意数据
+    orbitals_toggled = pyqtSignal(dict)  # 批量切换 {轨道键: 是否显示}
     view_mode_changed = pyqtSignal(str)
     settings_changed = pyqtSignal(dict)
 
+    # 框线设置键，下标即框线掩码中的位
+    _FRAME_KEYS = ('frame_top', 'frame_bottom', 'frame_left', 'frame_right')
+
+    # 面板默认绘图设置：冻结为只读映射，按引用发布，无需逐实例复制
+    _DEFAULT_PLOT_SETTINGS = MappingProxyType({
+        'fermi_window': (-5.0, 5.0),  # 默认费米窗口
+        'fermi_energy': 0.0,
+        'show_fermi_line': True,
+        'color_scheme': 'academic'
+    })
+
+    # 没有颜色信息的轨道使用的默认颜色
+    _DEFAULT_ORBITAL_COLOR = '#95A5A6'
+
+    # 刻度线方向：界面文字 -> matplotlib 参数
+    _TICK_DIRECTION_MAP = {"向内": "in", "向外": "out", "双向": "inout"}
+
+    # 设置控件类型 -> (变更信号名, 取值方法名)
+    _FIELD_SIGNALS = MappingProxyType({
+        QLineEdit: ('textChanged', 'text'),
+        QSpinBox: ('valueChanged', 'value'),
+        QDoubleSpinBox: ('valueChanged', 'value'),
+        QComboBox: ('currentTextChanged', 'currentText'),
+    })
+
+    # 图形标签页的常规设置行：(行, 标签, 属性名, 设置键, 控件类型, 控件配置)
+    _FIGURE_FIELDS = (
+        (0, "标题:", 'title_edit', 'title', QLineEdit,
+         {'text': "FPLO Band Structure with Orbital Projections", 'min_width': 120, 'max_width': 180}),
+        (1, "标题字体大小:", 'title_fontsize_spin', 'title_fontsize', QSpinBox,
+         {'range': (8, 24), 'value': 16, 'max_width': 100}),
+        (2, "X轴标签:", 'xlabel_edit', 'xlabel', QLineEdit,
+         {'text': "Wave vector", 'min_width': 120, 'max_width': 180}),
+        (3, "Y轴标签:", 'ylabel_edit', 'ylabel', QLineEdit,
+         {'text': "Energy (eV)", 'min_width': 120, 'max_width': 180}),
+        (4, "轴标签字体大小:", 'label_fontsize_spin', 'label_fontsize', QSpinBox,
+         {'range': (8, 20), 'value': 14, 'max_width': 100}),
+        (5, "图像DPI:", 'dpi_spin', 'figure_dpi', QSpinBox,
+         {'range': (72, 600), 'value': 150, 'max_width': 100}),
+        (7, "刻度线方向:", 'tick_direction_combo', 'tick_direction', QComboBox,
+         {'items': ["向内", "向外", "双向"], 'current': "向内", 'max_width': 150}),
+        (8, "刻度线宽度:", 'tick_width_spin', 'tick_width', QDoubleSpinBox,
+         {'range': (0.1, 5.0), 'value': 1.0, 'step': 0.1, 'max_width': 100}),
+        (9, "刻度线长度:", 'tick_length_spin', 'tick_length', QDoubleSpinBox,
+         {'range': (1.0, 20.0), 'value': 4.0, 'step': 0.5, 'max_width': 100}),  # 4.0 为 matplotlib 默认值
+        (12, "框线宽度:", 'frame_width_spin', 'frame_width', QDoubleSpinBox,
+         {'range': (0.1, 5.0), 'value': 1.0, 'step': 0.1, 'max_width': 100}),
+        (13, "数值标签字体大小:", 'tick_label_fontsize_spin', 'tick_label_fontsize', QSpinBox,
+         {'range': (6, 20), 'value': 12, 'max_width': 100}),
+        (14, "数值标签粗细:", 'tick_label_weight_combo', 'tick_label_weight', QComboBox,
+         {'items': ["normal", "bold"], 'current': "normal", 'max_width': 150}),
+        (15, "X轴标签位置:", 'xlabel_position_combo', 'xlabel_position', QComboBox,
+         {'items': ["bottom", "top"], 'current': "bottom", 'max_width': 150}),
+        (16, "X轴标签距离:", 'xlabel_pad_spin', 'xlabel_pad', QDoubleSpinBox,
+         {'range': (0, 50), 'value': 10, 'step': 1, 'max_width': 100}),
+        (17, "Y轴标签位置:", 'ylabel_position_combo', 'ylabel_position', QComboBox,
+         {'items': ["left", "right"], 'current': "left", 'max_width': 150}),
+        (18, "Y轴标签距离:", 'ylabel_pad_spin', 'ylabel_pad', QDoubleSpinBox,
+         {'range': (0, 50), 'value': 10, 'step': 1, 'max_width': 100}),
+    )
+
     def __init__(self):
         super().__init__()
-        self.orbital_checkboxes = {}
         self.element_checkboxes = {}
+        # 轨道名 -> 排序键，以及最近一次排序的轨道集合与结果
+        self._sort_key_cache = {}
+        self._sorted_key_set = frozenset()
+        self._sorted_orbital_keys = []
         self.elements = set()
         self.orbital_types = set()
         self.font_size = 12  # 默认字体大小
+        self._font_style_applied = False  # 统一样式表是否已设置
         
-        # 初始化绘图设置
-        self.plot_settings = {
-            'fermi_window': [-5.0, 5.0],  # 默认费米窗口
-            'fermi_energy': 0.0,
-            'show_fermi_line': True,
-            'color_scheme': 'academic'
-        }
+        # 初始化绘图设置（只读默认值，所有实例共享同一份）
+        self.plot_settings = self._DEFAULT_PLOT_SETTINGS
+
+        # 设置变更合并发送：连续变化（拖动滑块、输入文字）只在停顿后触发一次重绘
+        self._pending_settings = {}
+        self._pending_legend_settings = None
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(150)
+        self._settings_timer.timeout.connect(self._flush_settings)
+        self._emitted_settings = {}
+        self._last_settings_hash = None
+
+        # 框线掩码：当前状态与最近一次发送的状态（默认四边全显示）
+        self._frame_mask = 0b1111
+        self._last_emitted_frame_mask = 0b1111
         
         self.init_ui()
 
     def init_ui(self):
+        # 构建期间暂停重绘，避免启动时逐个控件触发的绘制
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _build_ui(self):
         # 使用主垂直布局
         main_layout = QVBoxLayout()
 
@@ -1523,7 +1850,7 @@ class ControlPanel(QWidget):
 
         # 轨道数量显示
         self.orbital_count_label = QLabel("轨道数量: 0")
-        self.orbital_count_label.setStyleSheet("color: #7F8C8D; font-size: 10px; padding: 2px;")
+        self.orbital_count_label.setObjectName("OrbitalCountLabel")
         first_row_layout.addWidget(self.orbital_count_label)
 
         first_row_layout.addStretch()  # 弹性空间
@@ -1567,7 +1894,7 @@ class ControlPanel(QWidget):
         # 费米线颜色
         fermi_layout.addWidget(QLabel("费米线颜色:"), 2, 0)
         self.fermi_color_btn = QPushButton()
-        self.fermi_color_btn.setStyleSheet("background-color: #FF0000;")
+        self.fermi_color_btn.setObjectName("FermiColorBtn")
         self.fermi_color_btn.clicked.connect(self.choose_fermi_color)
         fermi_layout.addWidget(self.fermi_color_btn, 2, 1, 1, 2)
 
@@ -1599,7 +1926,9 @@ class ControlPanel(QWidget):
         fermi_layout.addWidget(self.fermi_alpha_label, 5, 2)
 
         # 费米窗口设置
-        fermi_layout.addWidget(QLabel("费米窗口 (eV):"), 6, 0)
+        self.fermi_window_label = QLabel("费米窗口 (eV):")
+        self.fermi_window_label.setObjectName("FermiWindowLabel")
+        fermi_layout.addWidget(self.fermi_window_label, 6, 0)
         fermi_window_layout = QHBoxLayout()
 
         self.fermi_window_min = QDoubleSpinBox()
@@ -1622,8 +1951,56 @@ class ControlPanel(QWidget):
 
         self.fermi_tab.setLayout(fermi_layout)
 
+        # 删除重复的轨道显示控制标签页，使用现有的轨道显示控制模块
+
+        # 添加所有标签页：费米线页立即构建，其余先放占位页，首次切换到该页时再构建
+        settings_tabs.addTab(self.fermi_tab, "费米线")
+        self._tab_builders = {}
+        for tab_name, builder in [("能带", self._build_band_tab),
+                                  ("轨道", self._build_orbital_tab),
+                                  ("性能", self._build_performance_tab),
+                                  ("图形", self._build_figure_tab),
+                                  ("图例", self._build_legend_tab)]:
+            host = QWidget()
+            self._tab_builders[settings_tabs.addTab(host, tab_name)] = (host, builder)
+        self._tab_built = {settings_tabs.indexOf(self.fermi_tab)}
+        settings_tabs.currentChanged.connect(self._on_tab_changed)
+        self.settings_tabs = settings_tabs
+
+        # 创建底部设置区域（紧凑设计）
+        bottom_widget = QWidget()
+        bottom_widget.setMaximumHeight(280)  # 减少底部设置区域高度
+        bottom_widget.setMinimumHeight(220)  # 减少最小高度
+        bottom_layout = QVBoxLayout(bottom_widget)
+        bottom_layout.setContentsMargins(3, 3, 3, 3)  # 减少边距
+        bottom_layout.addWidget(settings_tabs)
+
+        # 底部区域添加到主布局，设置伸缩因子为0（固定大小）
+        main_layout.addWidget(bottom_widget, 0)
+
+        # 设置主布局
+        self.setLayout(main_layout)
+
+        # 应用初始字体样式
+        self.apply_unified_font_style(self.font_size)
+
+    @pyqtSlot(int)
+    def _on_tab_changed(self, index):
+        """首次切换到某个标签页时构建其控件"""
+        if index in self._tab_built or index not in self._tab_builders:
+            return
+        self._tab_built.add(index)
+        host, builder = self._tab_builders[index]
+        # 构建期间暂停重绘
+        host.setUpdatesEnabled(False)
+        try:
+            builder(host)
+        finally:
+            host.setUpdatesEnabled(True)
+
+    def _build_band_tab(self, host):
+        """构建能带设置标签页"""
         # ===== 能带设置标签页 =====
-        band_tab = QWidget()
         band_layout = QGridLayout()
 
         # 能带线显示控制
@@ -1635,7 +2012,7 @@ class ControlPanel(QWidget):
         # 能带线颜色
         band_layout.addWidget(QLabel("能带线颜色:"), 1, 0)
         self.band_color_btn = QPushButton()
-        self.band_color_btn.setStyleSheet("background-color: #000000;")
+        self.band_color_btn.setObjectName("BandColorBtn")
         self.band_color_btn.clicked.connect(self.choose_band_color)
         band_layout.addWidget(self.band_color_btn, 1, 1, 1, 2)
 
@@ -1667,10 +2044,11 @@ class ControlPanel(QWidget):
         band_layout.addWidget(self.band_alpha_label, 4, 2)
 
 
-        band_tab.setLayout(band_layout)
+        host.setLayout(band_layout)
 
+    def _build_orbital_tab(self, host):
+        """构建轨道设置标签页"""
         # ===== 轨道设置标签页 - 严格按照能带设置格式 =====
-        orbital_tab = QWidget()
         orbital_layout = QGridLayout()
 
         # 轨道点显示控制 - 按照能带的复选框格式
@@ -1726,10 +2104,11 @@ class ControlPanel(QWidget):
         self.weight_threshold_spin.valueChanged.connect(self.on_orbital_settings_changed)
         orbital_layout.addWidget(self.weight_threshold_spin, 5, 1, 1, 2)
 
-        # 不在这里设置orbital_tab的布局，因为后面会重新设置
-
-        # 删除多余的left_group代码
+        # 轨道标签页只包含轨道设置，不包含轨道显示控制
+        host.setLayout(orbital_layout)
 
+    def _build_performance_tab(self, host):
+        """构建性能设置标签页"""
         # 右列 - 性能设置
         right_group = QGroupBox("性能")
         right_layout = QGridLayout()
@@ -1744,7 +2123,7 @@ class ControlPanel(QWidget):
         right_layout.addWidget(QLabel("多核处理:"), 0, 0)
         self.use_multiprocessing = QCheckBox()
         self.use_multiprocessing.setChecked(True)
-        self.use_multiprocessing.setToolTip(f"使用多核处理加速绘图 (检测到{multiprocessing.cpu_count()}核)")
+        self.use_multiprocessing.setToolTip(_MP_TOOLTIP)
         self.use_multiprocessing.toggled.connect(self.on_orbital_settings_changed)
         right_layout.addWidget(self.use_multiprocessing, 0, 1)
 
@@ -1763,28 +2142,17 @@ class ControlPanel(QWidget):
         # [Deprecated 20250827] 旧逻辑：清除缓存按钮已移除
 
         right_group.setLayout(right_layout)
+        # 右列样式与面板统一样式表中的 QGroupBox 规则一致，无需单独设置
 
-        # 设置右列样式
-        right_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #BDC3C7;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
-
-        # 原有的orbital_tab布局已删除，轨道和性能已拆分为独立标签页
+        # 创建性能标签页
+        performance_layout = QVBoxLayout()
+        performance_layout.addWidget(right_group)  # 添加性能设置组
+        host.setLayout(performance_layout)
 
+    def _build_figure_tab(self, host):
+        """构建图形设置标签页"""
         # ===== 图形设置标签页 - 一列布局带滚动 =====
-        figure_tab = QWidget()
-        figure_tab_layout = QVBoxLayout(figure_tab)
+        figure_tab_layout = QVBoxLayout(host)
         figure_tab_layout.setContentsMargins(5, 5, 5, 5)
 
         # 创建滚动区域 - 只使用垂直滚动
@@ -1804,56 +2172,18 @@ class ControlPanel(QWidget):
         figure_layout.setColumnStretch(1, 2)  # 控件列，减小比例
         figure_layout.setColumnStretch(2, 0)  # 额外列，不占空间
 
-        # 标题设置
-        figure_layout.addWidget(QLabel("标题:"), 0, 0)
-        self.title_edit = QLineEdit("FPLO Band Structure with Orbital Projections")
-        self.title_edit.setMaximumWidth(180)  # 和XY轴标签输入框一样宽
-        self.title_edit.setMinimumWidth(120)  # 和XY轴标签输入框一样宽
-        self.title_edit.textChanged.connect(self.on_figure_settings_changed)
-        figure_layout.addWidget(self.title_edit, 0, 1)
-
-        # 标题字体大小
-        figure_layout.addWidget(QLabel("标题字体大小:"), 1, 0)
-        self.title_fontsize_spin = QSpinBox()
-        self.title_fontsize_spin.setRange(8, 24)
-        self.title_fontsize_spin.setValue(16)
-        self.title_fontsize_spin.setMaximumWidth(100)  # 限制宽度
-        self.title_fontsize_spin.valueChanged.connect(self.on_figure_settings_changed)
-        figure_layout.addWidget(self.title_fontsize_spin, 1, 1)
-
-        # X轴标签
-        figure_layout.addWidget(QLabel("X轴标签:"), 2, 0)
-        self.xlabel_edit = QLineEdit("Wave vector")
-        self.xlabel_edit.setMaximumWidth(180)  # 进一步限制宽度
-        self.xlabel_edit.setMinimumWidth(120)  # 设置最小宽度
-        self.xlabel_edit.textChanged.connect(self.on_figure_settings_changed)
-        figure_layout.addWidget(self.xlabel_edit, 2, 1)
-
-        # Y轴标签
-        figure_layout.addWidget(QLabel("Y轴标签:"), 3, 0)
-        self.ylabel_edit = QLineEdit("Energy (eV)")
-        self.ylabel_edit.setMaximumWidth(180)  # 进一步限制宽度
-        self.ylabel_edit.setMinimumWidth(120)  # 设置最小宽度
-        self.ylabel_edit.textChanged.connect(self.on_figure_settings_changed)
-        figure_layout.addWidget(self.ylabel_edit, 3, 1)
-
-        # 轴标签字体大小
-        figure_layout.addWidget(QLabel("轴标签字体大小:"), 4, 0)
-        self.label_fontsize_spin = QSpinBox()
-        self.label_fontsize_spin.setRange(8, 20)
-        self.label_fontsize_spin.setValue(14)
-        self.label_fontsize_spin.setMaximumWidth(100)  # 限制宽度
-        self.label_fontsize_spin.valueChanged.connect(self.on_figure_settings_changed)
-        figure_layout.addWidget(self.label_fontsize_spin, 4, 1)
-
-        # DPI设置
-        figure_layout.addWidget(QLabel("图像DPI:"), 5, 0)
-        self.dpi_spin = QSpinBox()
-        self.dpi_spin.setRange(72, 600)
-        self.dpi_spin.setValue(150)
-        self.dpi_spin.setMaximumWidth(100)  # 限制宽度
-        self.dpi_spin.valueChanged.connect(self.on_figure_settings_changed)
-        figure_layout.addWidget(self.dpi_spin, 5, 1)
+        # 常规设置行按表格创建，同时登记 控件 -> (设置键, 取值函数)，槽函数按发送者查表，只读取发生变化的那一项；
+        # 按行号分段创建，与特殊行穿插，保持控件创建（Tab 焦点）顺序与显示顺序一致
+        self._figure_widget_keys = {}
+
+        def add_fields(first_row, last_row):
+            for row, label, attr, key, cls, config in self._FIGURE_FIELDS:
+                if first_row <= row <= last_row:
+                    widget = self._add_field_row(figure_layout, row, label, attr, cls, config,
+                                                 self.on_figure_settings_changed)
+                    self._figure_widget_keys[widget] = (key, getattr(widget, self._FIELD_SIGNALS[cls][1]))
+
+        add_fields(0, 5)
 
         # 网格透明度
         figure_layout.addWidget(QLabel("网格透明度:"), 6, 0)
@@ -1865,41 +2195,19 @@ class ControlPanel(QWidget):
         figure_layout.addWidget(self.grid_alpha_slider, 6, 1)
         self.grid_alpha_label = QLabel("0.3")
         figure_layout.addWidget(self.grid_alpha_label, 6, 2)
+        self._figure_widget_keys[self.grid_alpha_slider] = ('grid_alpha', lambda: self.grid_alpha_slider.value() / 100.0)
 
-        # 刻度线方向
-        figure_layout.addWidget(QLabel("刻度线方向:"), 7, 0)
-        self.tick_direction_combo = QComboBox()
-        self.tick_direction_combo.addItems(["向内", "向外", "双向"])
-        self.tick_direction_combo.setCurrentText("向内")
-        self.tick_direction_combo.setMaximumWidth(150)  # 限制宽度
-        self.tick_direction_combo.currentTextChanged.connect(self.on_figure_settings_changed)
-        figure_layout.addWidget(self.tick_direction_combo, 7, 1)
-
-        # 刻度线宽度
-        figure_layout.addWidget(QLabel("刻度线宽度:"), 8, 0)
-        self.tick_width_spin = QDoubleSpinBox()
-        self.tick_width_spin.setRange(0.1, 5.0)
-        self.tick_width_spin.setValue(1.0)
-        self.tick_width_spin.setSingleStep(0.1)
-        self.tick_width_spin.setMaximumWidth(100)  # 限制宽度
-        self.tick_width_spin.valueChanged.connect(self.on_figure_settings_changed)
-        figure_layout.addWidget(self.tick_width_spin, 8, 1)
-
-        # 刻度线长度
-        figure_layout.addWidget(QLabel("刻度线长度:"), 9, 0)
-        self.tick_length_spin = QDoubleSpinBox()
-        self.tick_length_spin.setRange(1.0, 20.0)
-        self.tick_length_spin.setValue(4.0)  # matplotlib默认值
-        self.tick_length_spin.setSingleStep(0.5)
-        self.tick_length_spin.setMaximumWidth(100)  # 限制宽度
-        self.tick_length_spin.valueChanged.connect(self.on_figure_settings_changed)
-        figure_layout.addWidget(self.tick_length_spin, 9, 1)
+        add_fields(7, 9)
+        # 刻度线方向按中文选项映射为 matplotlib 取值
+        self._figure_widget_keys[self.tick_direction_combo] = ('tick_direction', lambda: self._TICK_DIRECTION_MAP.get(
+            self.tick_direction_combo.currentText(), "in"))
 
         # 显示刻度线
         self.show_ticks = QCheckBox("显示刻度线")
         self.show_ticks.setChecked(True)
         self.show_ticks.toggled.connect(self.on_figure_settings_changed)
         figure_layout.addWidget(self.show_ticks, 10, 0, 1, 3)
+        self._figure_widget_keys[self.show_ticks] = ('show_ticks', self.show_ticks.isChecked)
 
         # 框线显示
         figure_layout.addWidget(QLabel("框线显示:"), 11, 0)
@@ -1910,87 +2218,24 @@ class ControlPanel(QWidget):
         self.frame_bottom = QCheckBox("下")
         self.frame_left = QCheckBox("左")
         self.frame_right = QCheckBox("右")
-        for frame_cb in [self.frame_top, self.frame_bottom, self.frame_left, self.frame_right]:
+        # 四条框线共用一个处理函数，按位合成掩码（位顺序同 _FRAME_KEYS）
+        for bit, frame_cb in enumerate([self.frame_top, self.frame_bottom, self.frame_left, self.frame_right]):
             frame_cb.setChecked(True)
-            frame_cb.toggled.connect(self.on_figure_settings_changed)
+            frame_cb.toggled.connect(partial(self._on_frame_toggle, bit))
             frame_layout.addWidget(frame_cb)
         frame_layout.addStretch()  # 添加弹性空间保证全部显示
-        frame_widget = QWidget()
-        frame_widget.setLayout(frame_layout)
-        figure_layout.addWidget(frame_widget, 11, 1, 1, 2)
-
-        # 框线宽度
-        figure_layout.addWidget(QLabel("框线宽度:"), 12, 0)
-        self.frame_width_spin = QDoubleSpinBox()
-        self.frame_width_spin.setRange(0.1, 5.0)
-        self.frame_width_spin.setValue(1.0)
-        self.frame_width_spin.setSingleStep(0.1)
-        self.frame_width_spin.setMaximumWidth(100)  # 限制宽度
-        self.frame_width_spin.valueChanged.connect(self.on_figure_settings_changed)
-        figure_layout.addWidget(self.frame_width_spin, 12, 1)
-
-        # 数值标签字体大小
-        figure_layout.addWidget(QLabel("数值标签字体大小:"), 13, 0)
-        self.tick_label_fontsize_spin = QSpinBox()
-        self.tick_label_fontsize_spin.setRange(6, 20)
-        self.tick_label_fontsize_spin.setValue(12)
-        self.tick_label_fontsize_spin.setMaximumWidth(100)  # 限制宽度
-        self.tick_label_fontsize_spin.valueChanged.connect(self.on_figure_settings_changed)
-        figure_layout.addWidget(self.tick_label_fontsize_spin, 13, 1)
-
-        # 数值标签粗细
-        figure_layout.addWidget(QLabel("数值标签粗细:"), 14, 0)
-        self.tick_label_weight_combo = QComboBox()
-        self.tick_label_weight_combo.addItems(["normal", "bold"])
-        self.tick_label_weight_combo.setCurrentText("normal")
-        self.tick_label_weight_combo.setMaximumWidth(150)  # 限制宽度
-        self.tick_label_weight_combo.currentTextChanged.connect(self.on_figure_settings_changed)
-        figure_layout.addWidget(self.tick_label_weight_combo, 14, 1)
-
-        # X轴标签位置
-        figure_layout.addWidget(QLabel("X轴标签位置:"), 15, 0)
-        self.xlabel_position_combo = QComboBox()
-        self.xlabel_position_combo.addItems(["bottom", "top"])
-        self.xlabel_position_combo.setCurrentText("bottom")
-        self.xlabel_position_combo.setMaximumWidth(150)  # 限制宽度
-        self.xlabel_position_combo.currentTextChanged.connect(self.on_figure_settings_changed)
-        figure_layout.addWidget(self.xlabel_position_combo, 15, 1)
-
-        # X轴标签距离
-        figure_layout.addWidget(QLabel("X轴标签距离:"), 16, 0)
-        self.xlabel_pad_spin = QDoubleSpinBox()
-        self.xlabel_pad_spin.setRange(0, 50)
-        self.xlabel_pad_spin.setValue(10)  # 默认距离
-        self.xlabel_pad_spin.setSingleStep(1)
-        self.xlabel_pad_spin.setMaximumWidth(100)
-        self.xlabel_pad_spin.valueChanged.connect(self.on_figure_settings_changed)
-        figure_layout.addWidget(self.xlabel_pad_spin, 16, 1)
-
-        # Y轴标签位置
-        figure_layout.addWidget(QLabel("Y轴标签位置:"), 17, 0)
-        self.ylabel_position_combo = QComboBox()
-        self.ylabel_position_combo.addItems(["left", "right"])
-        self.ylabel_position_combo.setCurrentText("left")
-        self.ylabel_position_combo.setMaximumWidth(150)  # 限制宽度
-        self.ylabel_position_combo.currentTextChanged.connect(self.on_figure_settings_changed)
-        figure_layout.addWidget(self.ylabel_position_combo, 17, 1)
-
-        # Y轴标签距离
-        figure_layout.addWidget(QLabel("Y轴标签距离:"), 18, 0)
-        self.ylabel_pad_spin = QDoubleSpinBox()
-        self.ylabel_pad_spin.setRange(0, 50)
-        self.ylabel_pad_spin.setValue(10)  # 默认距离
-        self.ylabel_pad_spin.setSingleStep(1)
-        self.ylabel_pad_spin.setMaximumWidth(100)
-        self.ylabel_pad_spin.valueChanged.connect(self.on_figure_settings_changed)
-        figure_layout.addWidget(self.ylabel_pad_spin, 18, 1)
+        # 子布局直接放入网格单元，不再额外包一层 QWidget
+        figure_layout.addLayout(frame_layout, 11, 1, 1, 2)
+
+        add_fields(12, 18)
 
         # 设置滚动区域
         figure_scroll_area.setWidget(figure_scroll_widget)
         figure_tab_layout.addWidget(figure_scroll_area)
 
+    def _build_legend_tab(self, host):
+        """构建图例设置标签页"""
         # 图例设置标签页
-        legend_tab = QWidget()
         legend_layout = QGridLayout()
 
         # 图例字体大小
@@ -2048,59 +2293,47 @@ class ControlPanel(QWidget):
         self.legend_alpha_spin.valueChanged.connect(self.on_legend_settings_changed)
         legend_layout.addWidget(self.legend_alpha_spin, 5, 1)
 
-        legend_tab.setLayout(legend_layout)
-
-        # 轨道标签页只包含轨道设置，不包含轨道显示控制
-        orbital_tab.setLayout(orbital_layout)
-
-        # 创建性能标签页
-        performance_tab = QWidget()
-        performance_layout = QVBoxLayout()
-        performance_layout.addWidget(right_group)  # 添加性能设置组
-        performance_tab.setLayout(performance_layout)
-
-        # 删除重复的轨道显示控制标签页，使用现有的轨道显示控制模块
-
-        # 添加所有标签页
-        settings_tabs.addTab(self.fermi_tab, "费米线")
-        settings_tabs.addTab(band_tab, "能带")
-        settings_tabs.addTab(orbital_tab, "轨道")
-        settings_tabs.addTab(performance_tab, "性能")
-        settings_tabs.addTab(figure_tab, "图形")
-        settings_tabs.addTab(legend_tab, "图例")
-
-        # 创建底部设置区域（紧凑设计）
-        bottom_widget = QWidget()
-        bottom_widget.setMaximumHeight(280)  # 减少底部设置区域高度
-        bottom_widget.setMinimumHeight(220)  # 减少最小高度
-        bottom_layout = QVBoxLayout(bottom_widget)
-        bottom_layout.setContentsMargins(3, 3, 3, 3)  # 减少边距
-        bottom_layout.addWidget(settings_tabs)
-
-        # 底部区域添加到主布局，设置伸缩因子为0（固定大小）
-        main_layout.addWidget(bottom_widget, 0)
-
-        # 设置主布局
-        self.setLayout(main_layout)
-
-        # 应用初始字体样式
-        self.apply_unified_font_style(self.font_size)
-
+        host.setLayout(legend_layout)
+
+    def _add_field_row(self, layout, row, label, attr, cls, config, slot):
+        """按配置创建一行设置控件（标签 + 控件），保存为属性并连接变更信号，返回控件"""
+        layout.addWidget(QLabel(label), row, 0)
+        widget = cls()
+        if 'items' in config:
+            widget.addItems(config['items'])
+            widget.setCurrentText(config['current'])
+        if 'text' in config:
+            widget.setText(config['text'])
+        if 'range' in config:
+            widget.setRange(*config['range'])
+            widget.setValue(config['value'])
+        if 'step' in config:
+            widget.setSingleStep(config['step'])
+        if 'min_width' in config:
+            widget.setMinimumWidth(config['min_width'])
+        if 'max_width' in config:
+            widget.setMaximumWidth(config['max_width'])
+        getattr(widget, self._FIELD_SIGNALS[cls][0]).connect(slot)
+        layout.addWidget(widget, row, 1)
+        setattr(self, attr, widget)
+        return widget
+
+    @pyqtSlot(QAbstractButton)
     def on_view_button_clicked(self, button):
         """视图按钮点击处理 - 全新的简洁逻辑"""
         # 确定当前选中的模式
         if button == self.view_complete:
             current_mode = "complete"
-            print("用户选择: 完整能带模式")
+            log_debug("用户选择: 完整能带模式")
         elif button == self.view_fermi:
             current_mode = "fermi"
-            print("用户选择: 费米专注模式")
+            log_debug("用户选择: 费米专注模式")
         else:
-            print("未知的视图按钮")
+            log_debug("未知的视图按钮")
             return
 
         # 发送视图模式改变信号
-        print(f"发送视图模式改变信号: {current_mode}")
+        log_debug(f"发送视图模式改变信号: {current_mode}")
         self.view_mode_changed.emit(current_mode)
         
         # 更新费米能带数控件的启用状态
@@ -2112,28 +2345,13 @@ class ControlPanel(QWidget):
         is_fermi_mode = (mode == "fermi")
         
         
-        # 启用/禁用费米窗口控件
-        # 找到费米窗口标签
-        fermi_window_label = None
-        for i in range(self.fermi_tab.layout().count()):
-            item = self.fermi_tab.layout().itemAt(i)
-            if item and item.widget() and isinstance(item.widget(), QLabel):
-                if "费米窗口" in item.widget().text():
-                    fermi_window_label = item.widget()
-                    break
-        
-        if fermi_window_label:
-            fermi_window_label.setEnabled(is_fermi_mode)
-        
+        # 启用/禁用费米窗口控件（标签在构建费米线页时已缓存）
+        self.fermi_window_label.setEnabled(is_fermi_mode)
         self.fermi_window_min.setEnabled(is_fermi_mode)
         self.fermi_window_max.setEnabled(is_fermi_mode)
+        # 禁用时的灰色由统一样式表中的 :disabled 规则处理
         
-        # 更新样式以视觉上区分启用/禁用状态
-        style = "" if is_fermi_mode else "color: gray;"
-        if fermi_window_label:
-            fermi_window_label.setStyleSheet(style)
-        
-        print(f"费米相关控件{'启用' if is_fermi_mode else '禁用'}")
+        log_debug(f"费米相关控件{'启用' if is_fermi_mode else '禁用'}")
 
     def get_current_view_mode(self):
         """获取当前视图模式"""
@@ -2146,300 +2364,92 @@ class ControlPanel(QWidget):
 
     def set_view_mode_programmatically(self, mode):
         """程序化设置视图模式（不触发信号）"""
-        if mode == "complete":
-            self.view_complete.setChecked(True)
-        elif mode == "fermi":
-            self.view_fermi.setChecked(True)
+        buttons = (self.view_complete, self.view_fermi)
+        # 互斥按钮切换时两个按钮都会发出 toggled，期间屏蔽信号，结束后恢复原屏蔽状态
+        previous = [button.blockSignals(True) for button in buttons]
+        try:
+            if mode == "complete":
+                self.view_complete.setChecked(True)
+            elif mode == "fermi":
+                self.view_fermi.setChecked(True)
+        finally:
+            for button, blocked in zip(buttons, previous):
+                button.blockSignals(blocked)
         print(f"程序化设置视图模式为: {mode}")
 
-    def set_orbitals(self, visualizer):
-        """设置轨道信息 - 稳定版本"""
-        print(f"设置轨道信息...")
+    def set_orbitals(self, visualizer, keep_checked=False):
+        """设置轨道信息 - 稳定版本
+
+        keep_checked 为 True 时（如切换视图模式）保留仍存在的轨道的勾选状态，
+        否则（加载新数据）全部复位为未勾选。
+        """
+        log_debug("设置轨道信息...")
 
         # 保存轨道信息
         self.orbital_info = visualizer.orbital_info.copy()
         self.visualizer = visualizer
 
-        print(f"总轨道数: {len(self.orbital_info)}")
-
-        # 重新构建轨道控制
-        self.rebuild_orbital_controls()
-
-        # 检查结果
-        created_count = len(self.orbital_checkboxes)
-        expected_count = len(self.orbital_info)
-
-        print(f"轨道设置完成: {created_count}/{expected_count}")
-
-        # 检查是否有缺失
-        if created_count != expected_count:
-            missing_orbitals = set(self.orbital_info.keys()) - set(self.orbital_checkboxes.keys())
-            print(f"缺失轨道: {missing_orbitals}")
-            return False
-        else:
-            print("所有轨道都已创建")
-            return True
-
-    def rebuild_orbital_controls(self):
-        """重新构建轨道控制 - 稳定版本"""
-        # 检查orbital_content_layout是否存在
-        if not hasattr(self, 'orbital_content_layout'):
-            print("错误: orbital_content_layout不存在，需要先调用create_orbital_display_area()")
-            return
-
-        print(f"orbital_content_layout存在，当前项数: {self.orbital_content_layout.count()}")
+        log_debug(f"总轨道数: {len(self.orbital_info)}")
 
-        # 清除现有控件
-        self.clear_orbital_controls()
+        # 排序键只与轨道名有关，每个轨道名在整个会话中只解析一次
+        for orbital_key in self.orbital_info:
+            if orbital_key not in self._sort_key_cache:
+                self._sort_key_cache[orbital_key] = self.get_orbital_sort_key(orbital_key)
 
-        # 获取并排序轨道
-        orbital_keys = list(self.orbital_info.keys())
-        orbital_keys.sort(key=self.get_orbital_sort_key)
-
-        # 创建轨道控件
-        created_count = 0
-        failed_orbitals = []
-
-        for orbital_key in orbital_keys:
-            try:
-                self.create_orbital_checkbox(orbital_key)
-                created_count += 1
-            except Exception as e:
-                print(f"创建轨道 {orbital_key} 失败: {e}")
-                failed_orbitals.append(orbital_key)
-                continue
-
-        if failed_orbitals:
-            print(f"失败轨道: {failed_orbitals}")
-
-        print(f"创建了 {created_count} 个轨道控件")
+        # 重新构建轨道控制
+        self.rebuild_orbital_controls(keep_checked)
 
-        # 添加弹性空间
-        self.orbital_content_layout.addStretch()
+    def rebuild_orbital_controls(self, keep_checked=True):
+        """重新构建轨道控制：排序后按差异写入列表模型，只增删变化的行
 
-        # 强制更新布局
-        QApplication.processEvents()
-        self.orbital_content_widget.updateGeometry()
-        self.orbital_content_layout.activate()
-        self.orbital_content_widget.adjustSize()
-        QApplication.processEvents()
+        面板隐藏时也立即写入模型（菜单的全选/反选等直接操作模型，必须与当前数据一致）；
+        隐藏的视图不绘制，显示时才布局可见行。
+        """
+        # 获取并排序轨道：轨道集合不变（如切换视图模式）时直接复用上次的顺序
+        key_set = frozenset(self.orbital_info)
+        if key_set != self._sorted_key_set:
+            self._sorted_orbital_keys = sorted(key_set, key=self._sort_key_cache.__getitem__)
+            self._sorted_key_set = key_set
+        orbital_keys = self._sorted_orbital_keys
+
+        colors = getattr(self.visualizer, 'orbital_colors', {})
+        self.orbital_model.update_orbitals([
+            (orbital_key, len(self.orbital_info[orbital_key]),
+             colors.get(orbital_key, self._DEFAULT_ORBITAL_COLOR))
+            for orbital_key in orbital_keys], keep_checked)
 
         # 更新显示
         self.update_orbital_display()
-
-        # 强制显示所有相关widget - 多重保险
-        if hasattr(self, 'orbital_display_widget'):
-            self.orbital_display_widget.setVisible(True)
-            self.orbital_display_widget.show()
-            self.orbital_display_widget.raise_()
-
-        if hasattr(self, 'orbital_scroll_area'):
-            self.orbital_scroll_area.setVisible(True)
-            self.orbital_scroll_area.show()
-            self.orbital_scroll_area.raise_()
-
-        if hasattr(self, 'orbital_content_widget'):
-            self.orbital_content_widget.setVisible(True)
-            self.orbital_content_widget.show()
-            self.orbital_content_widget.raise_()
-
-        # 强制显示所有轨道复选框
-        for checkbox in self.orbital_checkboxes.values():
-            checkbox.setVisible(True)
-            checkbox.show()
-            checkbox.raise_()
-
-        # 强制更新布局和几何形状
-        QApplication.processEvents()
-
-        if hasattr(self, 'orbital_display_widget'):
-            self.orbital_display_widget.updateGeometry()
-            self.orbital_display_widget.update()
-            self.orbital_display_widget.repaint()
-
-        if hasattr(self, 'orbital_content_widget'):
-            self.orbital_content_widget.updateGeometry()
-            self.orbital_content_widget.update()
-            self.orbital_content_widget.repaint()
-
-        print(f"轨道控制重建完成，共 {len(self.orbital_checkboxes)} 个")
-        print(f"强制显示后 orbital_display_widget 可见性: {self.orbital_display_widget.isVisible() if hasattr(self, 'orbital_display_widget') else 'N/A'}")
-
-        # 检查所有复选框的最终可见性
-        visible_checkboxes = sum(1 for cb in self.orbital_checkboxes.values() if cb.isVisible())
-        print(f"最终可见的轨道复选框: {visible_checkboxes}/{len(self.orbital_checkboxes)}")
+        log_debug(f"轨道控制重建完成，共 {self.orbital_model.rowCount()} 个")
 
     def clear_orbital_controls(self):
-        """清除所有轨道控件"""
-        # 立即删除所有控件，不使用deleteLater()
-        widgets_to_delete = []
-        while self.orbital_content_layout.count():
-            child = self.orbital_content_layout.takeAt(0)
-            if child.widget():
-                widgets_to_delete.append(child.widget())
-            elif child.spacerItem():
-                # 删除弹性空间
-                del child
-
-        # 立即删除所有控件
-        for widget in widgets_to_delete:
-            widget.setParent(None)
-            del widget
-
-        # 清空字典
-        self.orbital_checkboxes.clear()
-
-        # 强制处理事件并再次检查
-        QApplication.processEvents()
-        self.orbital_content_widget.updateGeometry()
-        self.orbital_content_layout.update()
+        """清除所有轨道"""
+        self.orbital_model.set_orbitals([])
+        self.update_orbital_display()
 
     def get_orbital_sort_key(self, orbital_key):
         """获取轨道排序键"""
         # 规则：元素 → ℓ优先级(s<p<d<f) → 主量子数n升序 → 原串
-        try:
-            if '_' in orbital_key:
-                element, type_part = orbital_key.split('_', 1)
-            else:
-                element, type_part = orbital_key, orbital_key
-
-            # 提取 ℓ 字母
-            l_letter = type_part[-1] if (type_part and type_part[-1] in ['s', 'p', 'd', 'f']) else ''
-
-            # 提取 n（去掉最后一个 ℓ 字母后的数字部分）
-            n_part = type_part[:-1] if (len(type_part) > 1 and l_letter) else ''
-            try:
-                n_val = int(n_part) if n_part != '' else -1
-            except Exception:
-                n_val = 10**9  # 非法 n 放末尾
-
-            l_priority = {'s': 0, 'p': 1, 'd': 2, 'f': 3}.get(l_letter, 999)
-            return (element, l_priority, n_val, type_part)
-        except Exception:
-            return (orbital_key, 999, 10**9, orbital_key)
-
-    def create_orbital_checkbox(self, orbital_key):
-        """创建单个轨道复选框"""
-        # 检查轨道信息是否存在
-        if orbital_key not in self.orbital_info:
-            raise ValueError(f"轨道 {orbital_key} 不在轨道信息中")
-
-        # 获取轨道信息
-        weight_indices = self.orbital_info.get(orbital_key, [])
-        weight_count = len(weight_indices)
-
-        # 检查可视化器是否有颜色信息
-        if not hasattr(self.visualizer, 'orbital_colors'):
-            color = '#95A5A6'
+        if '_' in orbital_key:
+            element, type_part = orbital_key.split('_', 1)
         else:
-            color = self.visualizer.orbital_colors.get(orbital_key, '#95A5A6')
-
-        # 创建复选框 - 默认不选中，减少初始化时间
-        checkbox = QCheckBox(f"{orbital_key} ({weight_count})")
-        checkbox.setChecked(False)
-
-        # 设置样式 - 紧凑版本，间距减少为原来的一半
-        checkbox.setStyleSheet(f"""
-            QCheckBox {{
-                font-size: {self.font_size}px;
-                padding: 3px 4px;
-                color: #2C3E50;
-                min-height: 20px;
-                background-color: transparent;
-                margin: 1px 0px;
-            }}
-            QCheckBox:hover {{
-                background-color: #ECF0F1;
-                border-radius: 4px;
-            }}
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border: 2px solid {color};
-                border-radius: 4px;
-                background-color: white;
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {color};
-                border: 2px solid {color};
-            }}
-            QCheckBox::indicator:hover {{
-                border-width: 3px;
-            }}
-        """)
-
-        # 设置工具提示
-        checkbox.setToolTip(f"轨道: {orbital_key}\\n权重数量: {weight_count}\\n颜色: {color}")
-
-        # 连接信号
-        checkbox.toggled.connect(lambda checked, key=orbital_key:
-                               self.orbital_toggled.emit(key, checked))
-
-        # 保存引用
-        self.orbital_checkboxes[orbital_key] = checkbox
-
-        # 强化复选框可见性设置
-        checkbox.setVisible(True)
-        checkbox.show()
-
-        # 添加到布局
-        print(f"添加轨道复选框到布局: {orbital_key}")
-        self.orbital_content_layout.addWidget(checkbox)
-
-        # 强制处理事件并再次检查
-        QApplication.processEvents()
-
-        print(f"布局项数量现在为: {self.orbital_content_layout.count()}")
-        print(f"复选框 {orbital_key} 可见性: {checkbox.isVisible()}")
-        print(f"复选框父widget: {type(checkbox.parent()).__name__ if checkbox.parent() else 'None'}")
-
-        # 如果复选框仍然不可见，强制显示其父widget
-        if not checkbox.isVisible():
-            print(f"复选框 {orbital_key} 不可见，检查父widget链...")
-            parent = checkbox.parent()
-            while parent:
-                print(f"  父widget: {type(parent).__name__}, 可见: {parent.isVisible()}")
-                if not parent.isVisible():
-                    parent.setVisible(True)
-                    parent.show()
-                parent = parent.parent()
+            element, type_part = orbital_key, orbital_key
+
+        match = _ORBITAL_TYPE_RE.fullmatch(type_part)
+        if match:
+            n_digits, l_letter = match.groups()
+            n_val = int(n_digits) if n_digits else -1
+        elif type_part and type_part[-1] in 'spdf':
+            l_letter, n_val = type_part[-1], 10**9  # 非法 n 放末尾
+        else:
+            l_letter, n_val = '', -1
 
-        return checkbox
+        return (element, _L_PRIORITY.get(l_letter, 999), n_val, type_part)
 
     def update_orbital_display(self):
         """更新轨道显示"""
         # 更新轨道数量
-        count = len(self.orbital_checkboxes)
-        self.orbital_count_label.setText(f"轨道数量: {count}")
-
-        print(f"更新轨道显示:")
-        print(f"  轨道数量: {count}")
-        print(f"  布局项数量: {self.orbital_content_layout.count()}")
-
-        # 强制更新布局
-        self.orbital_content_widget.adjustSize()
-        self.orbital_scroll_area.updateGeometry()
-
-        # 检查是否需要滚动
-        content_height = self.orbital_content_widget.sizeHint().height()
-        content_min_height = self.orbital_content_widget.minimumSizeHint().height()
-        scroll_height = self.orbital_scroll_area.viewport().height()
-
-        print(f"  内容高度: {content_height}")
-        print(f"  内容最小高度: {content_min_height}")
-        print(f"  滚动区域高度: {scroll_height}")
-
-        # 如果内容高度太小，强制设置一个合理的高度
-        if count > 0 and content_height < count * 30:
-            estimated_height = count * 35 + 50  # 每个轨道35像素 + 边距
-            self.orbital_content_widget.setMinimumHeight(estimated_height)
-            print(f"  强制设置内容最小高度: {estimated_height}")
-            content_height = estimated_height
-
-        if content_height > scroll_height:
-            print("  内容超出滚动区域，滚动条将自动显示")
-        else:
-            print("  内容未超出滚动区域，无需滚动条")
+        self.orbital_count_label.setText(f"轨道数量: {self.orbital_model.rowCount()}")
 
     def refresh_orbital_scroll_area(self):
         """刷新轨道滚动区域 - 兼容旧接口"""
@@ -2447,23 +2457,23 @@ class ControlPanel(QWidget):
 
     # 旧的setup_orbital_controls方法已被rebuild_orbital_controls替代
 
+    @pyqtSlot()
     def select_all_orbitals(self):
         """全选所有轨道"""
-        for checkbox in self.orbital_checkboxes.values():
-            checkbox.setChecked(True)
-        print("已全选所有轨道")
+        self.orbital_model.set_all_checked(True)
+        log_debug("已全选所有轨道")
 
+    @pyqtSlot()
     def deselect_all_orbitals(self):
         """全不选所有轨道"""
-        for checkbox in self.orbital_checkboxes.values():
-            checkbox.setChecked(False)
-        print("已全不选所有轨道")
+        self.orbital_model.set_all_checked(False)
+        log_debug("已全不选所有轨道")
 
+    @pyqtSlot()
     def invert_orbital_selection(self):
         """反选轨道"""
-        for checkbox in self.orbital_checkboxes.values():
-            checkbox.setChecked(not checkbox.isChecked())
-        print("已反选轨道")
+        self.orbital_model.invert_checked()
+        log_debug("已反选轨道")
 
     def reset_zoom(self):
         """重置缩放"""
@@ -2473,15 +2483,23 @@ class ControlPanel(QWidget):
     # 删除了字体大小改变方法
 
     def apply_unified_font_style(self, font_size):
-        """应用统一的字体样式到所有界面元素"""
-        # 创建统一的字体样式
+        """应用统一的字体样式到所有界面元素；样式表只在构建面板时设置一次，之后的调用直接返回
+
+        已 polish 的子控件不会跟随父控件样式表中 font-size 的变化，
+        因此不提供运行中修改字号的路径。
+        """
+        if self._font_style_applied:
+            return
+        self._font_style_applied = True
+
+        # 创建统一的样式
         unified_style = f"""
+            /* 字号写在 QWidget 规则中：样式表对之后才创建的控件（懒构建的标签页）同样生效 */
             QWidget {{
                 font-size: {font_size}px;
                 font-family: "Microsoft YaHei", "SimHei", Arial, sans-serif;
             }}
             QGroupBox {{
-                font-size: {font_size}px;
                 font-weight: bold;
                 border: 2px solid #BDC3C7;
                 border-radius: 5px;
@@ -2492,11 +2510,9 @@ class ControlPanel(QWidget):
                 subcontrol-origin: margin;
                 left: 10px;
                 padding: 0 5px 0 5px;
-                font-size: {font_size}px;
                 font-weight: bold;
             }}
             QPushButton {{
-                font-size: {font_size}px;
                 padding: 4px 8px;
                 border: 1px solid #BDC3C7;
                 border-radius: 3px;
@@ -2508,19 +2524,13 @@ class ControlPanel(QWidget):
             QPushButton:pressed {{
                 background-color: #BDC3C7;
             }}
-            QLabel {{
-                font-size: {font_size}px;
-            }}
             QCheckBox {{
-                font-size: {font_size}px;
                 padding: 4px;
             }}
             QSpinBox, QDoubleSpinBox {{
-                font-size: {font_size}px;
                 padding: 2px;
             }}
             QComboBox {{
-                font-size: {font_size}px;
                 padding: 2px;
             }}
             QTabWidget::pane {{
@@ -2528,7 +2538,6 @@ class ControlPanel(QWidget):
                 border-radius: 3px;
             }}
             QTabBar::tab {{
-                font-size: {font_size}px;
                 padding: 6px 12px;
                 margin-right: 2px;
                 border: 1px solid #BDC3C7;
@@ -2543,147 +2552,96 @@ class ControlPanel(QWidget):
             QTabBar::tab:hover {{
                 background-color: #D5DBDB;
             }}
-        """
-
-        # 应用样式到整个控制面板
-        self.setStyleSheet(unified_style)
-
-        # 特别处理轨道复选框，保持颜色指示器
-        self.update_orbital_checkboxes_style(font_size)
-
-        print(f"已应用统一字体样式: {font_size}px")
-
-    def update_orbital_checkboxes_style(self, font_size):
-        """更新轨道复选框样式，保持颜色指示器"""
-        for orbital_key, checkbox in self.orbital_checkboxes.items():
-            # 获取轨道颜色
-            if hasattr(self, 'visualizer') and self.visualizer:
-                color = self.visualizer.orbital_colors.get(orbital_key, '#95A5A6')
-            else:
-                color = '#95A5A6'
-
-            # 设置带颜色指示器的样式
-            checkbox_style = f"""
-                QCheckBox {{
-                    font-size: {font_size}px;
-                    padding: 6px 8px;
-                    color: #2C3E50;
-                    min-height: 28px;
-                    background-color: transparent;
-                }}
-                QCheckBox:hover {{
-                    background-color: #ECF0F1;
-                    border-radius: 4px;
-                }}
-                QCheckBox::indicator {{
-                    width: 18px;
-                    height: 18px;
-                    border: 2px solid {color};
-                    border-radius: 4px;
-                    background-color: white;
-                }}
-                QCheckBox::indicator:checked {{
-                    background-color: {color};
-                    border: 2px solid {color};
-                }}
-                QCheckBox::indicator:hover {{
-                    border-width: 3px;
-                }}
-            """
-            checkbox.setStyleSheet(checkbox_style)
-
-    # 删除了测试轨道显示相关方法
-
-    def create_orbital_display_area(self):
-        """创建全新的轨道显示控制区域"""
-        print("创建新的轨道显示控制区域...")
-
-        # 检查是否已经创建过，避免重复创建
-        if hasattr(self, 'orbital_display_widget') and self.orbital_display_widget is not None:
-            print("轨道显示控制区域已存在，跳过重复创建")
-            return
 
-        # 主容器 - 紧凑设计
-        self.orbital_display_widget = QWidget()
-        main_layout = QVBoxLayout(self.orbital_display_widget)
-        main_layout.setContentsMargins(3, 3, 3, 3)  # 减少边距
-        main_layout.setSpacing(3)  # 减少间距
-
-        # 删除重复的信息栏，轨道数量已在上方显示
-
-        # 滚动区域 - 进一步优化高度设置
-        self.orbital_scroll_area = QScrollArea()
-        self.orbital_scroll_area.setWidgetResizable(True)
-        self.orbital_scroll_area.setMinimumHeight(250)  # 增加最小高度，确保轨道完全可见
-        self.orbital_scroll_area.setMaximumHeight(400)  # 适当增加最大高度
-
-        # 设置滚动条策略
-        self.orbital_scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.orbital_scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-
-        # 滚动内容容器
-        self.orbital_content_widget = QWidget()
-        self.orbital_content_layout = QVBoxLayout(self.orbital_content_widget)
-        self.orbital_content_layout.setContentsMargins(6, 6, 6, 6)  # 减少边距
-        self.orbital_content_layout.setSpacing(1)  # 轨道间距减少为原来的一半
-
-        # 设置滚动区域样式
-        self.orbital_scroll_area.setStyleSheet("""
-            QScrollArea {
+            /* 以下为原先逐个控件设置的样式，统一按 objectName 匹配 */
+            QLabel#OrbitalCountLabel {{
+                color: #7F8C8D;
+                font-size: 10px;
+                padding: 2px;
+            }}
+            QLabel#FermiWindowLabel:disabled {{
+                color: gray;
+            }}
+            QPushButton#FermiColorBtn {{
+                background-color: #FF0000;
+            }}
+            QPushButton#BandColorBtn {{
+                background-color: #000000;
+            }}
+            QListView#OrbitalListView {{
                 border: 1px solid #BDC3C7;
                 border-radius: 6px;
                 background-color: #FAFAFA;
-            }
-            QScrollBar:vertical {
+            }}
+            QListView#OrbitalListView QScrollBar:vertical {{
                 border: none;
                 background: #ECF0F1;
                 width: 14px;
                 border-radius: 7px;
                 margin: 0px;
-            }
-            QScrollBar::handle:vertical {
+            }}
+            QListView#OrbitalListView QScrollBar::handle:vertical {{
                 background: #BDC3C7;
                 border-radius: 7px;
                 min-height: 30px;
                 margin: 2px;
-            }
-            QScrollBar::handle:vertical:hover {
+            }}
+            QListView#OrbitalListView QScrollBar::handle:vertical:hover {{
                 background: #95A5A6;
-            }
-            QScrollBar::handle:vertical:pressed {
+            }}
+            QListView#OrbitalListView QScrollBar::handle:vertical:pressed {{
                 background: #7F8C8D;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+            }}
+            QListView#OrbitalListView QScrollBar::add-line:vertical,
+            QListView#OrbitalListView QScrollBar::sub-line:vertical {{
                 height: 0px;
-            }
-        """)
-
-        # 设置滚动内容 - 确保正确的父子关系
-        self.orbital_scroll_area.setWidget(self.orbital_content_widget)
-        main_layout.addWidget(self.orbital_scroll_area)
+            }}
+        """
 
-        # 初始化轨道复选框字典
-        self.orbital_checkboxes = {}
+        # 应用样式到整个控制面板
+        self.setStyleSheet(unified_style)
 
-        # 强制显示所有widget - 多重保险
-        self.orbital_display_widget.setVisible(True)
-        self.orbital_display_widget.show()
+        log_debug(f"已应用统一字体样式: {font_size}px")
 
-        self.orbital_scroll_area.setVisible(True)
-        self.orbital_scroll_area.show()
+    def update_orbital_checkboxes_style(self, font_size):
+        """更新轨道颜色指示器（字号由根控件字体继承）"""
+        colors = getattr(getattr(self, 'visualizer', None), 'orbital_colors', {})
+        self.orbital_model.set_colors(colors, self._DEFAULT_ORBITAL_COLOR)
 
-        self.orbital_content_widget.setVisible(True)
-        self.orbital_content_widget.show()
+    # 删除了测试轨道显示相关方法
 
-        # 强制处理事件
-        QApplication.processEvents()
+    def create_orbital_display_area(self):
+        """创建轨道显示控制区域：QListView + 轨道列表模型"""
+        # 检查是否已经创建过，避免重复创建
+        if hasattr(self, 'orbital_display_widget') and self.orbital_display_widget is not None:
+            log_debug("轨道显示控制区域已存在，跳过重复创建")
+            return
 
-        print("轨道显示控制区域创建完成")
-        print(f"orbital_display_widget可见性: {self.orbital_display_widget.isVisible()}")
-        print(f"orbital_scroll_area可见性: {self.orbital_scroll_area.isVisible()}")
-        print(f"orbital_content_widget可见性: {self.orbital_content_widget.isVisible()}")
-        print(f"orbital_content_widget父widget: {type(self.orbital_content_widget.parent()).__name__ if self.orbital_content_widget.parent() else 'None'}")
+        # 主容器 - 紧凑设计
+        self.orbital_display_widget = QWidget()
+        main_layout = QVBoxLayout(self.orbital_display_widget)
+        main_layout.setContentsMargins(3, 3, 3, 3)  # 减少边距
+        main_layout.setSpacing(3)  # 减少间距
 
+        # 轨道列表：所有行等高，视图只为可见行计算尺寸和绘制
+        self.orbital_model = OrbitalListModel(self)
+        self.orbital_model.orbital_toggled.connect(self.orbital_toggled)
+        self.orbital_model.orbitals_toggled.connect(self.orbitals_toggled)
+        self.orbital_list_view = QListView()
+        self.orbital_list_view.setObjectName("OrbitalListView")
+        self.orbital_list_view.setModel(self.orbital_model)
+        self.orbital_list_view.setItemDelegate(OrbitalItemDelegate(self.orbital_list_view))
+        self.orbital_list_view.setUniformItemSizes(True)
+        self.orbital_list_view.setSelectionMode(QListView.NoSelection)
+        self.orbital_list_view.setMouseTracking(True)
+        self.orbital_list_view.viewport().setAttribute(Qt.WA_Hover)
+        self.orbital_list_view.setMinimumHeight(250)  # 确保轨道完全可见
+        self.orbital_list_view.setMaximumHeight(400)
+        self.orbital_list_view.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.orbital_list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        main_layout.addWidget(self.orbital_list_view)
+
+    @pyqtSlot()
     def on_legend_settings_changed(self):
         """图例设置改变"""
         legend_settings = {
@@ -2698,13 +2656,57 @@ class ControlPanel(QWidget):
             'edgecolor': 'black'
         }
 
-        # 发送图例设置信号
-        self.orbital_toggled.emit("LEGEND_SETTINGS", legend_settings)
+        # 合并后延迟发送图例设置信号
+        self._pending_legend_settings = legend_settings
+        self._settings_timer.start()
+
+    def _queue_settings(self, settings):
+        """合并待发送的设置并（重新）启动延迟计时器"""
+        self._pending_settings.update(settings)
+        self._settings_timer.start()
 
+    def _on_frame_toggle(self, bit, checked):
+        """框线复选框切换：更新掩码，仅当掩码与上次发送的不同才排队发送"""
+        if checked:
+            self._frame_mask |= 1 << bit
+        else:
+            self._frame_mask &= ~(1 << bit)
+
+        if self._frame_mask == self._last_emitted_frame_mask:
+            # 来回切换后回到已发送的状态，撤销待发送的框线设置
+            for key in self._FRAME_KEYS:
+                self._pending_settings.pop(key, None)
+            return
+
+        self._queue_settings({key: bool(self._frame_mask >> i & 1)
+                              for i, key in enumerate(self._FRAME_KEYS)})
+
+    @pyqtSlot()
+    def _flush_settings(self):
+        """一次性发送合并后的设置"""
+        if self._pending_settings:
+            settings, self._pending_settings = self._pending_settings, {}
+            # 与已发送状态合并后取哈希，值没有实际变化（如点进点出输入框）则不发送
+            snapshot = {**self._emitted_settings, **settings}
+            settings_hash = hash(tuple(sorted(
+                (key, tuple(value) if isinstance(value, list) else value)
+                for key, value in snapshot.items())))
+            if settings_hash != self._last_settings_hash:
+                self._emitted_settings = snapshot
+                self._last_settings_hash = settings_hash
+                if self._FRAME_KEYS[0] in settings:
+                    self._last_emitted_frame_mask = self._frame_mask
+                self.settings_changed.emit(settings)
+        if self._pending_legend_settings is not None:
+            legend_settings, self._pending_legend_settings = self._pending_legend_settings, None
+            self.orbital_toggled.emit("LEGEND_SETTINGS", legend_settings)
+
+    @pyqtSlot()
     def on_fermi_settings_changed(self):
         """费米线设置改变"""
-        fermi_alpha = self.fermi_alpha_slider.value() / 100.0
-        self.fermi_alpha_label.setText(f"{fermi_alpha:.1f}")
+        fermi_alpha_value = self.fermi_alpha_slider.value()
+        fermi_alpha = fermi_alpha_value / 100.0
+        self.fermi_alpha_label.setText(_ALPHA_STRINGS[fermi_alpha_value])
 
         settings = {
             'fermi_energy': self.fermi_energy_spin.value(),
@@ -2714,12 +2716,14 @@ class ControlPanel(QWidget):
             'fermi_line_alpha': fermi_alpha,
             'fermi_window': [self.fermi_window_min.value(), self.fermi_window_max.value()]
         }
-        self.settings_changed.emit(settings)
+        self._queue_settings(settings)
 
+    @pyqtSlot()
     def on_band_settings_changed(self):
         """能带设置改变"""
-        band_alpha = self.band_alpha_slider.value() / 100.0
-        self.band_alpha_label.setText(f"{band_alpha:.1f}")
+        band_alpha_value = self.band_alpha_slider.value()
+        band_alpha = band_alpha_value / 100.0
+        self.band_alpha_label.setText(_ALPHA_STRINGS[band_alpha_value])
 
         settings = {
             'show_band_lines': self.show_band_lines.isChecked(),
@@ -2727,87 +2731,75 @@ class ControlPanel(QWidget):
             'band_line_width': self.band_width_spin.value(),
             'band_line_alpha': band_alpha,
         }
-        self.settings_changed.emit(settings)
+        self._queue_settings(settings)
 
+    @pyqtSlot()
     def update_alpha_label(self):
         """更新透明度标签"""
-        point_alpha = self.point_alpha_slider.value() / 100.0
-        self.point_alpha_label.setText(f"{point_alpha:.1f}")
+        self.point_alpha_label.setText(_ALPHA_STRINGS[self.point_alpha_slider.value()])
 
+    @pyqtSlot()
     def on_orbital_settings_changed(self):
-        """轨道权重设置改变"""
-        point_size = self.point_size_spin.value()  # 直接从输入框获取值
-        point_alpha = self.point_alpha_slider.value() / 100.0
-
-        # 更新透明度标签
-        self.update_alpha_label()
-
+        """轨道权重设置改变（轨道页与性能页共用，只读取已构建的标签页）"""
         # 移除颜色方案处理，因为已在顶部导航栏处理
         # [Deprecated 20250827] 设置中移除了 cache_enabled 字段（缓存机制废弃）
-        settings = {
-            'point_size_factor': point_size,
-            'point_alpha': point_alpha,
-            'point_min_size': self.min_point_size_spin.value(),
-            'point_max_size': self.max_point_size_spin.value(),
-            'weight_threshold': self.weight_threshold_spin.value(),
-            'max_points_per_orbital': self.max_points_spin.value(),
-            'use_multiprocessing': self.use_multiprocessing.isChecked(),
-        }
-        self.settings_changed.emit(settings)
-
+        settings = {}
+        if hasattr(self, 'point_size_spin'):
+            # 更新透明度标签
+            self.update_alpha_label()
+            settings.update({
+                'point_size_factor': self.point_size_spin.value(),  # 直接从输入框获取值
+                'point_alpha': self.point_alpha_slider.value() / 100.0,
+                'point_min_size': self.min_point_size_spin.value(),
+                'point_max_size': self.max_point_size_spin.value(),
+                'weight_threshold': self.weight_threshold_spin.value(),
+            })
+        if hasattr(self, 'max_points_spin'):
+            settings.update({
+                'max_points_per_orbital': self.max_points_spin.value(),
+                'use_multiprocessing': self.use_multiprocessing.isChecked(),
+            })
+        self._queue_settings(settings)
+
+    @pyqtSlot()
     def on_figure_settings_changed(self):
-        """图形设置改变"""
-        grid_alpha = self.grid_alpha_slider.value() / 100.0
-        self.grid_alpha_label.setText(f"{grid_alpha:.1f}")
-
-        # 刻度线方向映射
-        tick_direction_map = {"向内": "in", "向外": "out", "双向": "inout"}
-        tick_direction = tick_direction_map.get(self.tick_direction_combo.currentText(), "in")
-
-        settings = {
-            'title': self.title_edit.text(),
-            'xlabel': self.xlabel_edit.text(),
-            'ylabel': self.ylabel_edit.text(),
-            'title_fontsize': self.title_fontsize_spin.value(),
-            'label_fontsize': self.label_fontsize_spin.value(),
-            'figure_dpi': self.dpi_spin.value(),
-            'grid_alpha': grid_alpha,
-            # 新增的刻度线设置
-            'tick_direction': tick_direction,
-            'tick_width': self.tick_width_spin.value(),
-            'tick_length': self.tick_length_spin.value(),
-            'show_ticks': self.show_ticks.isChecked(),
-            # 新增的框线设置
-            'frame_top': self.frame_top.isChecked(),
-            'frame_bottom': self.frame_bottom.isChecked(),
-            'frame_left': self.frame_left.isChecked(),
-            'frame_right': self.frame_right.isChecked(),
-            'frame_width': self.frame_width_spin.value(),
-            # 新增的坐标轴标签设置
-            'tick_label_fontsize': self.tick_label_fontsize_spin.value(),
-            'tick_label_weight': self.tick_label_weight_combo.currentText(),
-            'xlabel_position': self.xlabel_position_combo.currentText(),
-            'ylabel_position': self.ylabel_position_combo.currentText(),
-            'xlabel_pad': self.xlabel_pad_spin.value(),
-            'ylabel_pad': self.ylabel_pad_spin.value()
-        }
-        self.settings_changed.emit(settings)
-
+        """图形设置改变：按发送者查表，只排队发送该控件对应的一项设置"""
+        key, read = self._figure_widget_keys[self.sender()]
+        value = read()
+        if key == 'grid_alpha':
+            self.grid_alpha_label.setText(_ALPHA_STRINGS[self.grid_alpha_slider.value()])
+        self._queue_settings({key: value})
+
+    @pyqtSlot()
     def choose_fermi_color(self):
         """选择费米线颜色"""
-        color = QColorDialog.getColor()
-        if color.isValid():
-            self.fermi_color_btn.setStyleSheet(f"background-color: {color.name()};")
-            settings = {'fermi_line_color': color.name()}
-            self.settings_changed.emit(settings)
+        self._open_color_dialog(self._apply_fermi_color)
 
+    @pyqtSlot()
     def choose_band_color(self):
         """选择能带线颜色"""
-        color = QColorDialog.getColor()
+        self._open_color_dialog(self._apply_band_color)
+
+    def _open_color_dialog(self, on_selected):
+        """以 open() 打开非阻塞的颜色对话框，确认后回调 on_selected(color)"""
+        dialog = QColorDialog(self)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.colorSelected.connect(on_selected)
+        dialog.open()
+
+    @pyqtSlot(QColor)
+    def _apply_fermi_color(self, color):
+        """应用选中的费米线颜色"""
+        if color.isValid():
+            self.fermi_color_btn.setStyleSheet(f"background-color: {color.name()};")
+            self._queue_settings({'fermi_line_color': color.name()})
+
+    @pyqtSlot(QColor)
+    def _apply_band_color(self, color):
+        """应用选中的能带线颜色"""
         if color.isValid():
             self.band_color_btn.setStyleSheet(f"background-color: {color.name()};")
-            settings = {'band_line_color': color.name()}
-            self.settings_changed.emit(settings)
+            self._queue_settings({'band_line_color': color.name()})
 
 # ============================================================================
 # 5. 日志组件模块
@@ -2827,7 +2819,7 @@ class LegacyMainWindow(QMainWindow):
     pass
 
 def check_environment():
-    """检查运行环境"""
+    """检查运行环境（仅在设置 FPLO_DIAG 环境变量时由 main() 调用）"""
     print("检查运行环境...")
 
     # 检查Python版本
@@ -2842,13 +2834,13 @@ def check_environment():
     except:
         print("无法获取Qt版本信息")
 
-    # 检查matplotlib
-    try:
-        import matplotlib
-        print(f"matplotlib版本: {matplotlib.__version__}")
-        print(f"matplotlib后端: {matplotlib.get_backend()}")
-    except:
-        print("matplotlib检查失败")
+    # 检查matplotlib（只读取已导入的模块，不为诊断触发导入）
+    mpl = sys.modules.get('matplotlib')
+    if mpl is not None:
+        print(f"matplotlib版本: {mpl.__version__}")
+        print(f"matplotlib后端: {mpl.get_backend()}")
+    else:
+        print("matplotlib尚未导入")
 
     # 检查显示环境
     display = os.environ.get('DISPLAY', '未设置')
@@ -2859,8 +2851,9 @@ def check_environment():
 def main():
     """主函数"""
     try:
-        # 环境检查
-        check_environment()
+        # 环境检查：默认跳过，设置 FPLO_DIAG 时打印诊断信息
+        if os.environ.get('FPLO_DIAG'):
+            check_environment()
 
         # 设置Qt环境变量以提高兼容性
         os.environ.setdefault('QT_QPA_PLATFORM_PLUGIN_PATH', '')
@@ -42,6 +42,11 @@ class FPLOVisualizer:
         self.band_energies = None
         self.band_weights = None
         self.num_bands = 0
+        # 权重仅用于求和与点大小映射，float32 足够且减半内存带宽；
+        # 如需 float64 精度比较可关闭此开关
+        self.use_float32_weights = True
+        # k 点与能带能量只用于绘图（Agg 后端内部即按 float32 处理），同样以 float32 存储
+        self.use_float32_coords = True
         self.output_folder = None
         
         # 25种精选颜色调色板
@@ -354,9 +359,11 @@ class FPLOVisualizer:
             self.band_energies.append(energies_at_k)
             self.band_weights.append(weights_at_k)
         
-        self.k_points = np.array(self.k_points)
-        self.band_energies = np.array(self.band_energies)
-        self.band_weights = np.array(self.band_weights)
+        coords_dtype = np.float32 if self.use_float32_coords else None
+        self.k_points = np.array(self.k_points, dtype=coords_dtype)
+        self.band_energies = np.array(self.band_energies, dtype=coords_dtype)
+        weights_dtype = np.float32 if self.use_float32_weights else None
+        self.band_weights = np.array(self.band_weights, dtype=weights_dtype)
         self.num_bands = num_bands
         
         # 计算完整能量范围
@@ -436,10 +443,11 @@ class FPLOVisualizer:
                 # 归一化权重到合适的大小范围
                 w_max = np.max(w_dense)
                 if w_max > 0:
-                    w_normalized = w_dense / w_max  # 归一化到0-1
-                    point_sizes = base_size + w_normalized * (max_size - base_size)
+                    # 归一化与缩放合并为一次乘法 + 原地加法，少分配临时数组
+                    point_sizes = np.multiply(w_dense, (max_size - base_size) / w_max)
+                    point_sizes += base_size
                 else:
-                    point_sizes = np.ones_like(w_dense) * base_size
+                    point_sizes = np.full_like(w_dense, base_size)
 
                 # 绘制散点
                 scatter = ax.scatter(k_dense, e_dense,
@@ -458,10 +466,11 @@ class FPLOVisualizer:
             max_size = 100
             w_max = np.max(w_significant)
             if w_max > 0:
-                w_normalized = w_significant / w_max
-                point_sizes = base_size + w_normalized * (max_size - base_size)
+                # 归一化与缩放合并为一次乘法 + 原地加法，少分配临时数组
+                point_sizes = np.multiply(w_significant, (max_size - base_size) / w_max)
+                point_sizes += base_size
             else:
-                point_sizes = np.ones_like(w_significant) * base_size
+                point_sizes = np.full_like(w_significant, base_size)
 
             # 绘制散点
             scatter = ax.scatter(k_significant, e_significant,
@@ -604,11 +613,13 @@ class FPLOVisualizer:
                 continue
 
             color = self.orbital_colors.get(orbital_key, '#95A5A6')
+            # 轨道列下标只转换一次，循环内单次高级索引，不再先复制整个能带切片
+            cols = np.asarray(indices, dtype=np.intp)
             has_visible_weight = False
 
             for band_idx in range(self.num_bands):
                 band_energies = self.band_energies[:, band_idx]
-                orbital_weights = np.sum(self.band_weights[:, band_idx, :][:, indices], axis=1)
+                orbital_weights = np.sum(self.band_weights[:, band_idx, cols], axis=1)
 
                 # 权重阈值
                 mask = orbital_weights > 0.01
@@ -734,13 +745,14 @@ class FPLOVisualizer:
 
                 # 绘制该轨道的权重
                 color = self.orbital_colors.get(orbital_key, '#95A5A6')
+                cols = np.asarray(indices, dtype=np.intp)
                 max_weight = 0
                 min_weight = float('inf')
                 has_data = False
 
                 for band_idx in range(self.num_bands):
                     band_energies = self.band_energies[:, band_idx]
-                    orbital_weights = np.sum(self.band_weights[:, band_idx, :][:, indices], axis=1)
+                    orbital_weights = np.sum(self.band_weights[:, band_idx, cols], axis=1)
 
                     # 更低的阈值用于单轨道图
                     mask = orbital_weights > 0.005
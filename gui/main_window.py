@@ -143,6 +143,7 @@ class MainWindow(QMainWindow):
         self.control_panel.setMaximumWidth(350)
 
         self.control_panel.orbital_toggled.connect(self.plot_widget.toggle_orbital_visibility)
+        self.control_panel.orbitals_toggled.connect(self.plot_widget.set_orbitals_visibility)
         self.control_panel.view_mode_changed.connect(self.plot_widget.set_view_mode)
         self.control_panel.settings_changed.connect(self.plot_widget.update_plot_settings)
 
@@ -331,7 +332,7 @@ class MainWindow(QMainWindow):
             self.progress_bar.setValue(0)
             self.loader_thread = DataLoaderThread(filename)
             self.loader_thread.progress.connect(self.progress_bar.setValue)
-            self.loader_thread.status.connect(lambda msg: log_info(msg))
+            self.loader_thread.status.connect(log_info)
             self.loader_thread.finished.connect(self.on_data_loaded)
             self.loader_thread.error.connect(self.on_load_error)
             self.loader_thread.start()
@@ -388,13 +389,14 @@ class MainWindow(QMainWindow):
                 self.performance_monitor_process.kill()
             except Exception as e:
                 log_error(f"关闭性能监控进程时出错: {e}")
+        self.plot_widget.multicore_processor.close()
         logger.finalize_log()
         event.accept()
 
     def refresh_plot(self):
         """刷新图形"""
         if self.plot_widget.visualizer:
-            self.plot_widget.plot_current_view()
+            self.plot_widget.plot_current_view(force=True)
             self.log_widget.log_info("图形已刷新")
 
     def set_academic_style(self):
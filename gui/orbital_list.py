@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+轨道列表模块：
+- OrbitalListModel: 轨道勾选列表的数据模型（按行存储键、标签、颜色、勾选状态）
+- OrbitalItemDelegate: 绘制带轨道颜色指示器的勾选行
+
+说明：轨道显示控制由 QListView + 模型实现，只绘制可见行，
+不再为每个轨道创建一个 QCheckBox 控件。
+"""
+
+from functools import lru_cache
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QEvent, QRect, QRectF, QSize, pyqtSignal
+from PyQt5.QtGui import QColor, QPainter, QPen
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyle
+
+# 自定义数据角色：轨道颜色
+ORBITAL_COLOR_ROLE = Qt.UserRole + 1
+
+
+@lru_cache(maxsize=1024)
+def _orbital_label(key, count):
+    """行文字；相同 (轨道, 权重数量) 在重建与视图切换之间共用同一字符串"""
+    return f"{key} ({count})"
+
+
+@lru_cache(maxsize=1024)
+def _orbital_tooltip(key, count, color):
+    """行提示；相同 (轨道, 权重数量, 颜色) 共用同一字符串"""
+    return f"轨道: {key}\n权重数量: {count}\n颜色: {color}"
+
+
+class OrbitalListModel(QAbstractListModel):
+    """轨道勾选列表模型"""
+
+    # 用户切换某个轨道的勾选状态: (轨道键, 是否勾选)；参数类型与 ControlPanel.orbital_toggled
+    # 一致 (str, object)，才能直接做信号到信号的连接
+    orbital_toggled = pyqtSignal(str, object)
+    # 批量操作（全选/全不选/反选）一次报告所有变化: {轨道键: 是否勾选}
+    orbitals_toggled = pyqtSignal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._keys = []
+        self._labels = []
+        self._tooltips = []
+        self._colors = []
+        self._counts = []
+        self._checked = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._keys)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return self._labels[row]
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self._checked[row] else Qt.Unchecked
+        if role == ORBITAL_COLOR_ROLE:
+            return self._colors[row]
+        if role == Qt.ToolTipRole:
+            return self._tooltips[row]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+
+    def setData(self, index, value, role=Qt.CheckStateRole):
+        """用户勾选/取消某一行"""
+        if not index.isValid() or role != Qt.CheckStateRole:
+            return False
+        row = index.row()
+        checked = value == Qt.Checked
+        if self._checked[row] != checked:
+            self._checked[row] = checked
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+            self.orbital_toggled.emit(self._keys[row], checked)
+        return True
+
+    def set_orbitals(self, orbitals):
+        """整体替换轨道列表，orbitals 为 [(轨道键, 权重数量, 颜色), ...]；勾选状态全部复位且不发信号"""
+        self.beginResetModel()
+        self._keys = [key for key, _, _ in orbitals]
+        self._counts = [count for _, count, _ in orbitals]
+        self._colors = [color for _, _, color in orbitals]
+        self._labels = [_orbital_label(key, count) for key, count, _ in orbitals]
+        self._tooltips = [_orbital_tooltip(key, count, color) for key, count, color in orbitals]
+        self._checked = [False] * len(self._keys)
+        self.endResetModel()
+
+    def update_orbitals(self, orbitals, keep_checked=True):
+        """按差异更新轨道列表：共有的行原地更新，只删除消失的行、插入新增的行
+
+        orbitals 须与当前列表采用同一排序；共有轨道的相对顺序不一致时退化为整体替换。
+        keep_checked 为 False 时共有行的勾选状态也复位（不发信号）。
+        """
+        new_keys = [key for key, _, _ in orbitals]
+        new_set = set(new_keys)
+        old_set = set(self._keys)
+        if ([key for key in self._keys if key in new_set]
+                != [key for key in new_keys if key in old_set]):
+            self.set_orbitals(orbitals)
+            return
+
+        # 删除消失的轨道：从后往前，连续的行合并为一次删除
+        row = len(self._keys) - 1
+        while row >= 0:
+            if self._keys[row] in new_set:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and self._keys[row] not in new_set:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            for column in self._columns():
+                del column[row + 1:last + 1]
+            self.endRemoveRows()
+
+        # 逐行对齐：共有行原地更新，新增行就地插入
+        changed = []
+        for row, (key, count, color) in enumerate(orbitals):
+            if row < len(self._keys) and self._keys[row] == key:
+                if (self._counts[row] != count or self._colors[row] != color
+                        or (self._checked[row] and not keep_checked)):
+                    self._counts[row] = count
+                    self._colors[row] = color
+                    self._labels[row] = _orbital_label(key, count)
+                    self._tooltips[row] = _orbital_tooltip(key, count, color)
+                    self._checked[row] = self._checked[row] and keep_checked
+                    changed.append(row)
+                continue
+            self.beginInsertRows(QModelIndex(), row, row)
+            for column, value in zip(self._columns(), (key, _orbital_label(key, count),
+                                                        _orbital_tooltip(key, count, color), color, count, False)):
+                column.insert(row, value)
+            self.endInsertRows()
+        if changed:
+            self.dataChanged.emit(self.index(min(changed)), self.index(max(changed)))
+
+    def set_colors(self, colors, default_color):
+        """按 {轨道键: 颜色} 更新所有行的颜色，只发一次 dataChanged"""
+        if not self._keys:
+            return
+        self._colors = [colors.get(key, default_color) for key in self._keys]
+        self._tooltips = [_orbital_tooltip(key, count, color)
+                          for key, count, color in zip(self._keys, self._counts, self._colors)]
+        self.dataChanged.emit(self.index(0), self.index(len(self._keys) - 1),
+                              [ORBITAL_COLOR_ROLE, Qt.ToolTipRole])
+
+    def set_all_checked(self, checked):
+        """全选/全不选：状态一次写入，只发一次 dataChanged 与一次批量信号"""
+        changed = [row for row, state in enumerate(self._checked) if state != checked]
+        self._apply_checked(changed, [checked] * len(changed))
+
+    def invert_checked(self):
+        """反选所有轨道"""
+        rows = list(range(len(self._keys)))
+        self._apply_checked(rows, [not state for state in self._checked])
+
+    def _apply_checked(self, rows, states):
+        if not rows:
+            return
+        for row, state in zip(rows, states):
+            self._checked[row] = state
+        self.dataChanged.emit(self.index(min(rows)), self.index(max(rows)), [Qt.CheckStateRole])
+        self.orbitals_toggled.emit({self._keys[row]: state for row, state in zip(rows, states)})
+
+    def _columns(self):
+        """按行存储的各列，顺序与 update_orbitals 中插入的值一致"""
+        return (self._keys, self._labels, self._tooltips, self._colors, self._counts, self._checked)
+
+
+class OrbitalItemDelegate(QStyledItemDelegate):
+    """绘制轨道行：圆角颜色指示器 + 文字；点击整行或按空格切换勾选"""
+
+    INDICATOR_SIZE = 18
+    MIN_ROW_HEIGHT = 28
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        rect = option.rect
+
+        # 悬停背景
+        if option.state & QStyle.State_MouseOver:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor('#ECF0F1'))
+            painter.drawRoundedRect(QRectF(rect), 4, 4)
+
+        # 颜色指示器：边框为轨道颜色，勾选时填充
+        color = QColor(index.data(ORBITAL_COLOR_ROLE))
+        checked = index.data(Qt.CheckStateRole) == Qt.Checked
+        size = self.INDICATOR_SIZE
+        box = QRectF(rect.left() + 4, rect.center().y() - size / 2 + 1, size, size)
+        painter.setPen(QPen(color, 2))
+        painter.setBrush(color if checked else QColor('white'))
+        painter.drawRoundedRect(box.adjusted(1, 1, -1, -1), 4, 4)
+
+        # 文字
+        painter.setPen(QColor('#2C3E50'))
+        painter.setFont(option.font)
+        text_rect = QRect(rect.left() + size + 12, rect.top(), rect.width() - size - 16, rect.height())
+        painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft, index.data(Qt.DisplayRole))
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), max(option.fontMetrics.height() + 10, self.MIN_ROW_HEIGHT))
+
+    def editorEvent(self, event, model, option, index):
+        event_type = event.type()
+        if event_type == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            self._toggle(model, index)
+            return True
+        if event_type == QEvent.MouseButtonDblClick:
+            return True
+        if event_type == QEvent.KeyPress and event.key() in (Qt.Key_Space, Qt.Key_Select):
+            self._toggle(model, index)
+            return True
+        return False
+
+    @staticmethod
+    def _toggle(model, index):
+        state = Qt.Unchecked if index.data(Qt.CheckStateRole) == Qt.Checked else Qt.Checked
+        model.setData(index, state, Qt.CheckStateRole)
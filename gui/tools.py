@@ -3,6 +3,9 @@
 工具类模块：
 - MultiCoreProcessor: 多核处理器
 - process_single_orbital: 单轨道处理函数
+- filter_topk: 阈值过滤 + 权重最大的前 K 个点（可选 numba 内核）
+- compute_orbital_weights: 多轨道权重求和（可选 numba 并行）
+- chunked_weight_to_size: 拼接后的多块权重按块映射为散点大小
 - DataLoaderThread: 数据加载线程
 
 说明：按照项目决策，已删除增量缓存机制（PlotCache）。当前采用全量重绘，
@@ -10,32 +13,239 @@
 """
 
 import multiprocessing
+from functools import partial
+
 import numpy as np
 from PyQt5.QtCore import QThread, pyqtSignal
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# CPU 核心数在运行期间不变，导入时查询一次
+_CPU_COUNT = multiprocessing.cpu_count()
+
+
+def _process_batch(process_func, batch):
+    """线程后端的单个任务：顺序处理一批条目"""
+    return [process_func(data) for data in batch]
+
 
 class MultiCoreProcessor:
-    """多核处理器"""
+    """多核处理器
+
+    进程池/线程池在首次并行调用时创建并持续复用，避免每次调用都重新启动工作进程、
+    重新导入 numpy；程序退出前调用 close() 释放。
+    """
+
+    # 线程后端每个任务处理的条目数，摊薄任务分发开销
+    THREAD_BATCH_SIZE = 8
 
     def __init__(self):
-        self.cpu_count = multiprocessing.cpu_count()
+        self.cpu_count = _CPU_COUNT
+        self._executor = None
+        self._thread_executor = None
+        # 两个持久池当前的工作者数目，请求数目变化时据此重建
+        self._executor_workers = 0
+        self._thread_executor_workers = 0
         print(f"检测到 {self.cpu_count} 个CPU核心")
 
-    def process_orbitals_parallel(self, orbital_data_list, process_func, max_workers=None):
-        """并行处理轨道数据"""
+    def _get_executor(self, max_workers):
+        """获取持久进程池（惰性创建）；请求的工作进程数变化时关闭旧池并按新数目重建"""
+        if self._executor is not None and self._executor_workers != max_workers:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._executor = ProcessPoolExecutor(max_workers=max_workers)
+            self._executor_workers = max_workers
+        return self._executor
+
+    def _get_thread_executor(self, max_workers):
+        """获取持久线程池（惰性创建）；请求的线程数变化时关闭旧池并按新数目重建"""
+        if self._thread_executor is not None and self._thread_executor_workers != max_workers:
+            self._thread_executor.shutdown(wait=False)
+            self._thread_executor = None
+        if self._thread_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._thread_executor = ThreadPoolExecutor(max_workers=max_workers)
+            self._thread_executor_workers = max_workers
+        return self._thread_executor
+
+    def process_orbitals_parallel(self, orbital_data_list, process_func, max_workers=None,
+                                  backend='process'):
+        """并行处理轨道数据
+
+        backend='thread' 时在本进程内用线程池处理：数组无需序列化，适合释放 GIL 的
+        NumPy/numba 计算，条目按 THREAD_BATCH_SIZE 分批提交；默认 'process' 使用进程池。
+        max_workers 未指定时取CPU核心数，持久池按该数目创建。
+        """
         if max_workers is None:
-            max_workers = min(self.cpu_count, len(orbital_data_list))
+            max_workers = self.cpu_count
         if max_workers <= 1 or len(orbital_data_list) <= 1:
             return [process_func(data) for data in orbital_data_list]
+        if backend == 'thread':
+            batch_size = self.THREAD_BATCH_SIZE
+            batches = [orbital_data_list[i:i + batch_size]
+                       for i in range(0, len(orbital_data_list), batch_size)]
+            batch_results = self._get_thread_executor(max_workers).map(
+                partial(_process_batch, process_func), batches)
+            return [result for results in batch_results for result in results]
         try:
-            from concurrent.futures import ProcessPoolExecutor
-            with ProcessPoolExecutor(max_workers=max_workers) as executor:
-                results = list(executor.map(process_func, orbital_data_list))
-            return results
+            # 按块分发，减少进程间往返次数
+            chunksize = max(1, len(orbital_data_list) // (max_workers * 4))
+            return list(self._get_executor(max_workers).map(process_func, orbital_data_list,
+                                                            chunksize=chunksize))
         except Exception as e:
             print(f"多核处理失败，回退到单核: {e}")
+            # 进程池可能已损坏（如工作进程崩溃），丢弃后下次调用重新创建
+            self.close()
             return [process_func(data) for data in orbital_data_list]
 
+    def close(self):
+        """关闭持久进程池与线程池"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._thread_executor is not None:
+            self._thread_executor.shutdown(wait=False)
+            self._thread_executor = None
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _orbital_weight_sums_kernel(band_weights, offsets, indices):
+        """按 CSR (offsets, indices) 对各轨道的权重列求和，prange 并行遍历轨道"""
+        num_k, num_bands = band_weights.shape[0], band_weights.shape[1]
+        num_orbitals = offsets.shape[0] - 1
+        out = np.zeros((num_orbitals, num_k, num_bands), dtype=band_weights.dtype)
+        for o in prange(num_orbitals):
+            for k in range(num_k):
+                for b in range(num_bands):
+                    acc = 0.0
+                    for j in range(offsets[o], offsets[o + 1]):
+                        acc += band_weights[k, b, indices[j]]
+                    out[o, k, b] = acc
+        return out
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _filter_topk_kernel(weights, threshold, max_points):
+        """返回 weights > threshold 的下标；超过 max_points 个时只保留权重最大的 max_points 个
+
+        先单次计数；需要裁剪时用大小为 max_points 的最小堆扫描一遍（O(N log K)），不做全排序。
+        """
+        n = weights.shape[0]
+        count = 0
+        for i in range(n):
+            if weights[i] > threshold:
+                count += 1
+
+        if count <= max_points:
+            out = np.empty(count, dtype=np.int64)
+            j = 0
+            for i in range(n):
+                if weights[i] > threshold:
+                    out[j] = i
+                    j += 1
+            return out
+
+        heap = np.empty(max_points, dtype=np.int64)
+        size = 0
+        for i in range(n):
+            w = weights[i]
+            if w <= threshold:
+                continue
+            if size < max_points:
+                # 上浮
+                pos = size
+                size += 1
+                while pos > 0:
+                    parent = (pos - 1) >> 1
+                    if weights[heap[parent]] <= w:
+                        break
+                    heap[pos] = heap[parent]
+                    pos = parent
+                heap[pos] = i
+            elif w > weights[heap[0]]:
+                # 替换堆顶后下沉
+                pos = 0
+                while True:
+                    child = 2 * pos + 1
+                    if child >= size:
+                        break
+                    if child + 1 < size and weights[heap[child + 1]] < weights[heap[child]]:
+                        child += 1
+                    if weights[heap[child]] >= w:
+                        break
+                    heap[pos] = heap[child]
+                    pos = child
+                heap[pos] = i
+        return heap
+
+
+def filter_topk(weights, threshold, max_points):
+    """超过阈值的点的下标，最多保留权重最大的 max_points 个（顺序不保证）
+
+    可用 numba 时走单遍扫描内核，否则 flatnonzero + argpartition。
+    max_points <= 0 时直接返回空数组，两条路径结果一致。
+    """
+    if max_points <= 0:
+        return np.empty(0, dtype=np.intp)
+    if NUMBA_AVAILABLE:
+        return _filter_topk_kernel(np.ascontiguousarray(weights), weights.dtype.type(threshold),
+                                   int(max_points))
+
+    idx = np.flatnonzero(weights > threshold)
+    if idx.size > max_points:
+        # 只需权重最大的 max_points 个点，无需全排序：argpartition 为 O(N)
+        top = np.argpartition(weights[idx], -max_points)[-max_points:]
+        idx = idx[top]
+    return idx
+
+
+def chunked_weight_to_size(weights, lengths, min_size, max_size, size_factor):
+    """拼接后的权重按块各自线性映射为散点大小：min + w/w_max*(max-min)*factor
+
+    w_max 为所在块的最大权重，为 0 的块全部取最小点大小。
+    weights 为各块依次拼接的一维数组，lengths 为各块长度（均大于 0）；
+    每次绘制只分配常数个数组，不再为每个轨道-能带块各分配一个大小数组。
+    """
+    lengths = np.asarray(lengths, dtype=np.intp)
+    starts = np.zeros(len(lengths), dtype=np.intp)
+    np.cumsum(lengths[:-1], out=starts[1:])
+    w_max = np.maximum.reduceat(weights, starts)
+    scale = np.zeros_like(w_max)
+    np.divide((max_size - min_size) * size_factor, w_max, out=scale, where=w_max > 0)
+
+    point_sizes = np.multiply(weights, np.repeat(scale, lengths))
+    point_sizes += min_size
+    return point_sizes
+
+
+def compute_orbital_weights(band_weights, offsets, indices):
+    """一次性计算多个轨道的权重和
+
+    band_weights 形状为 (nk, nbands, norb)；第 o 个轨道使用的权重列为
+    indices[offsets[o]:offsets[o+1]]。返回形状 (n_orbitals, nk, nbands)。
+    可用 numba 时在进程内多线程计算（无需序列化大数组），否则回退到 NumPy。
+    """
+    offsets = np.ascontiguousarray(offsets, dtype=np.intp)
+    indices = np.ascontiguousarray(indices, dtype=np.intp)
+    if NUMBA_AVAILABLE:
+        return _orbital_weight_sums_kernel(np.ascontiguousarray(band_weights), offsets, indices)
+
+    num_orbitals = len(offsets) - 1
+    out = np.zeros((num_orbitals,) + band_weights.shape[:2], dtype=band_weights.dtype)
+    for o in range(num_orbitals):
+        cols = indices[offsets[o]:offsets[o + 1]]
+        if len(cols):
+            np.sum(band_weights[:, :, cols], axis=2, out=out[o])
+    return out
+
 
 def process_single_orbital(orbital_data):
     """处理单个轨道的函数（用于多核处理）"""
@@ -44,20 +254,14 @@ def process_single_orbital(orbital_data):
     weight_threshold = settings.get('weight_threshold', 0.02)
     max_points = settings.get('max_points_per_orbital', 500)
 
-    mask = weights > weight_threshold
-    if not np.any(mask):
+    # 阈值过滤 + 取权重最大的 max_points 个点，得到下标后每个数组只收集一次
+    idx = filter_topk(weights, weight_threshold, max_points)
+    if idx.size == 0:
         return None
 
-    k_filtered = k_points[mask]
-    e_filtered = energies[mask]
-    w_filtered = weights[mask]
-
-    if len(k_filtered) > max_points:
-        import numpy as _np
-        sample_indices = _np.argsort(w_filtered)[-max_points:]
-        k_filtered = k_filtered[sample_indices]
-        e_filtered = e_filtered[sample_indices]
-        w_filtered = w_filtered[sample_indices]
+    k_filtered = k_points[idx].astype(np.float32, copy=False)
+    e_filtered = energies[idx].astype(np.float32, copy=False)
+    w_filtered = weights[idx].astype(np.float32, copy=False)
 
     return {
         'orbital_key': orbital_key,
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""界面冒烟测试：在 offscreen 平台上构建控制面板与主窗口"""
+
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("PyQt5")
+pytest.importorskip("numpy")
+pytest.importorskip("matplotlib")
+
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def test_control_panel_builds(app):
+    from fplo_gui_main import ControlPanel
+
+    panel = ControlPanel()
+    assert panel.orbital_model.rowCount() == 0
+
+
+def test_main_window_builds(app):
+    from gui.main_window import MainWindow
+
+    window = MainWindow()
+    window.close()
+
+
+def test_orbital_toggle_reaches_panel_signal(app):
+    from PyQt5.QtCore import Qt
+    from fplo_gui_main import ControlPanel
+
+    panel = ControlPanel()
+    model = panel.orbital_model
+    model.set_orbitals([('Fe_3d', 5, '#E74C3C'), ('Fe_4s', 1, '#3498DB')])
+    received = []
+    panel.orbital_toggled.connect(lambda key, visible: received.append((key, visible)))
+    model.setData(model.index(0), Qt.Checked, Qt.CheckStateRole)
+    assert received == [('Fe_3d', True)]
+
+
+def test_hidden_panel_keeps_orbital_model_current(app):
+    from types import SimpleNamespace
+    from fplo_gui_main import ControlPanel
+
+    panel = ControlPanel()
+    panel.set_orbitals(SimpleNamespace(orbital_info={'Fe_3d': [0], 'Fe_4s': [1]}, orbital_colors={}))
+    panel.hide()
+    panel.set_orbitals(SimpleNamespace(orbital_info={'Co_3d': [0], 'Co_4s': [1], 'O_2p': [2]},
+                                       orbital_colors={}))
+
+    received = []
+    panel.orbitals_toggled.connect(received.append)
+    panel.select_all_orbitals()
+    assert received == [{'Co_3d': True, 'Co_4s': True, 'O_2p': True}]
+    assert panel.orbital_count_label.text().endswith("3")
+
+
+def test_lazy_tabs_use_panel_font_size(app):
+    from fplo_gui_main import ControlPanel
+
+    panel = ControlPanel()
+    panel.show()
+    for index in range(panel.settings_tabs.count()):
+        panel.settings_tabs.setCurrentIndex(index)
+    for widget in (panel.fermi_energy_spin, panel.title_edit, panel.point_size_spin,
+                   panel.legend_fontsize_spin, panel.select_all_orbitals_btn):
+        widget.ensurePolished()
+        assert widget.font().pixelSize() == panel.font_size
+
+
+def test_unified_font_style_applied_once(app):
+    from fplo_gui_main import ControlPanel
+
+    panel = ControlPanel()
+    style = panel.styleSheet()
+    panel.apply_unified_font_style(18)
+    assert panel.styleSheet() == style
+
+
+def test_multicore_pool_follows_max_workers():
+    from gui.tools import MultiCoreProcessor
+
+    processor = MultiCoreProcessor()
+    try:
+        data = list(range(20))
+        assert processor.process_orbitals_parallel(data, abs, max_workers=2, backend='thread') == data
+        assert processor._thread_executor_workers == 2
+        assert processor.process_orbitals_parallel(data, abs, max_workers=3, backend='thread') == data
+        assert processor._thread_executor_workers == 3
+        assert processor.process_orbitals_parallel(data, abs, max_workers=2) == data
+        assert processor._executor_workers == 2
+    finally:
+        processor.close()
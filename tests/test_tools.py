@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""gui.tools 数值函数测试：numba 内核与 NumPy 回退路径结果一致"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("PyQt5")
+np = pytest.importorskip("numpy")
+
+from gui import tools  # noqa: E402
+
+BACKENDS = [
+    pytest.param(True, id="numba",
+                 marks=pytest.mark.skipif(not tools.NUMBA_AVAILABLE, reason="numba 未安装")),
+    pytest.param(False, id="numpy"),
+]
+
+
+@pytest.fixture(params=BACKENDS)
+def use_numba(request, monkeypatch):
+    monkeypatch.setattr(tools, "NUMBA_AVAILABLE", request.param)
+    return request.param
+
+
+def _topk_reference(weights, threshold, max_points):
+    """暴力参考：超过阈值的点按权重降序全排序后取前 max_points 个"""
+    if max_points <= 0:
+        return []
+    idx = np.flatnonzero(weights > threshold)
+    order = np.argsort(-weights[idx], kind="stable")
+    return sorted(idx[order[:max_points]].tolist())
+
+
+@pytest.mark.parametrize("weights, threshold, max_points", [
+    # 随机权重，需要裁剪
+    (np.random.default_rng(0).random(200, dtype=np.float32), 0.3, 17),
+    # 并列权重全部落在保留范围内
+    (np.array([0.9, 0.5, 0.9, 0.1, 0.5, 0.8, 0.9], dtype=np.float32), 0.2, 4),
+    # 超过阈值的点数不超过 max_points
+    (np.array([0.1, 0.6, 0.05, 0.7], dtype=np.float32), 0.2, 5),
+    (np.array([0.1, 0.6, 0.05, 0.7], dtype=np.float32), 0.2, 2),
+    # max_points 为 0
+    (np.array([0.1, 0.6, 0.05, 0.7], dtype=np.float32), 0.2, 0),
+    # 没有点超过阈值
+    (np.array([0.1, 0.05], dtype=np.float32), 0.2, 3),
+])
+def test_filter_topk_matches_reference(use_numba, weights, threshold, max_points):
+    result = tools.filter_topk(weights, threshold, max_points)
+    assert sorted(result.tolist()) == _topk_reference(weights, threshold, max_points)
+
+
+def test_filter_topk_ties_at_cutoff(use_numba):
+    # 截断处并列时保留哪个下标不确定，只比较保留点的权重
+    weights = np.array([0.5, 0.9, 0.5, 0.5, 0.7, 0.1], dtype=np.float32)
+    result = tools.filter_topk(weights, 0.2, 3)
+    assert len(set(result.tolist())) == 3
+    assert sorted(weights[result].tolist()) == pytest.approx([0.5, 0.7, 0.9])
+
+
+def test_compute_orbital_weights_matches_column_sums(use_numba):
+    rng = np.random.default_rng(1)
+    band_weights = rng.random((7, 5, 6), dtype=np.float32)
+    # 各轨道的权重列，含一个空集
+    column_sets = [[0, 2], [5], [], [1, 3, 4]]
+    offsets = np.cumsum([0] + [len(cols) for cols in column_sets])
+    indices = np.array([c for cols in column_sets for c in cols], dtype=np.intp)
+
+    sums = tools.compute_orbital_weights(band_weights, offsets, indices)
+
+    assert sums.shape == (len(column_sets), 7, 5)
+    for orbital_sums, cols in zip(sums, column_sets):
+        np.testing.assert_allclose(orbital_sums, band_weights[:, :, cols].sum(axis=2), rtol=1e-6)